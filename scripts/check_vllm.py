@@ -10,13 +10,17 @@ import sys
 import time
 import os
 
+# 轮询期间复用 keep-alive 连接，避免每秒重新握手
+_SESSION = requests.Session()
+
+
 def check_vllm_status(base_url: str | None = None):
     """检查vLLM服务状态"""
     try:
         # 解析 Base URL（参数 > 环境变量 > 默认 localhost）
         base = base_url or os.environ.get("VLLM_BASE_URL") or "http://localhost:8000"
         # 检查模型列表
-        response = requests.get(f"{base.rstrip('/')}/v1/models", timeout=5)
+        response = _SESSION.get(f"{base.rstrip('/')}/v1/models", timeout=(1, 5))
         
         if response.status_code == 200:
             models = response.json()
@@ -49,15 +53,23 @@ def wait_for_service(max_wait=300, base_url: str | None = None):
     """等待服务启动"""
     print(f"⏳ 等待 vLLM 服务启动 (最多 {max_wait} 秒)...")
     
-    for i in range(max_wait):
+    start = time.monotonic()
+    next_report = 10
+    delay = 0.2
+    while True:
         if check_vllm_status(base_url=base_url):
             print("🎉 服务已就绪！")
             return True
         
-        if i % 10 == 0:
-            print(f"⏳ 已等待 {i} 秒...")
+        elapsed = time.monotonic() - start
+        if elapsed >= max_wait:
+            break
+        if elapsed >= next_report:
+            print(f"⏳ 已等待 {int(elapsed)} 秒...")
+            next_report += 10
         
-        time.sleep(1)
+        time.sleep(min(delay, max_wait - elapsed))
+        delay = min(2.0, delay * 1.5)
     
     print("⏰ 等待超时，服务可能启动失败")
     return False
@@ -38,6 +38,8 @@ export PATH=$CUDA_HOME/bin:$PATH
 # 模型配置
 MODEL=${MODEL:-Qwen/Qwen3-32B-AWQ}
 PORT=${PORT:-8000}
+# 前缀缓存：同一篇内各批次共享 system + few-shot 前缀，开启后只需 prefill 新增部分
+ENABLE_PREFIX_CACHING=${ENABLE_PREFIX_CACHING:-1}
 
 # 根据模型自动调整配置
 if [[ "$MODEL" == *"32B"* && "$MODEL" != *"AWQ"* ]]; then
@@ -67,6 +69,7 @@ echo "[vLLM] Max sequences: $MAX_NUM_SEQS"
 echo "[vLLM] KV cache dtype: $KV_CACHE_DTYPE"
 echo "[vLLM] Using attention backend: $VLLM_ATTENTION_BACKEND"
 echo "[vLLM] Logging level: $VLLM_LOGGING_LEVEL"
+echo "[vLLM] Prefix caching: $ENABLE_PREFIX_CACHING"
 echo "[vLLM] LD_LIBRARY_PATH: $LD_LIBRARY_PATH"
 
 # 构建 vLLM 命令
@@ -89,6 +92,10 @@ if [[ "$KV_CACHE_DTYPE" != "auto" ]]; then
     VLLM_CMD="$VLLM_CMD --kv-cache-dtype $KV_CACHE_DTYPE"
 fi
 
+if [[ "$ENABLE_PREFIX_CACHING" == "1" ]]; then
+    VLLM_CMD="$VLLM_CMD --enable-prefix-caching"
+fi
+
 if [[ "$TRUST_REMOTE_CODE" == "1" ]]; then
     VLLM_CMD="$VLLM_CMD --trust-remote-code"
 fi
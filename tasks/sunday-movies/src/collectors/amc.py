@@ -4,27 +4,53 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+import re
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, Iterable, List, Optional
 
 import requests
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:  # pragma: no cover - optional dependency
-    BeautifulSoup = None  # type: ignore
-
 try:  # pragma: no cover - import path shim for direct module execution
-    from .models import MovieSchedule, Showtime
+    from .models import MovieSchedule, Showtime, intern_format_tags
 except ImportError:  # pragma: no cover
-    from models import MovieSchedule, Showtime  # type: ignore
-
-try:
-    import cloudscraper
-except ImportError:  # pragma: no cover - optional dependency
-    cloudscraper = None
+    from models import MovieSchedule, Showtime, intern_format_tags  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# 等价于 strptime 的 "%I:%M %p" / "%I %p"，但免去每个按钮都走 locale 感知的 strptime
+_TIME_RE = re.compile(r"(\d{1,2})(?::(\d{1,2}))?\s+(AM|PM)")
+
+
+# bs4 / cloudscraper 导入较重，推迟到真正构造 collector 时再加载
+@lru_cache(maxsize=None)
+def _load_bs4():
+    try:
+        import bs4
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return bs4
+
+
+@lru_cache(maxsize=None)
+def _html_parser_name() -> str:
+    """lxml 建树比标准库 html.parser 快数倍，未安装时回退。"""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:  # pragma: no cover - optional dependency
+        return "html.parser"
+    return "lxml"
+
+
+@lru_cache(maxsize=None)
+def _load_cloudscraper():
+    try:
+        import cloudscraper
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return cloudscraper
+
 
 class AMCShowtimeCollector:
     """Scrape AMC theatre showtimes for a given date."""
@@ -46,8 +72,10 @@ class AMCShowtimeCollector:
         timeout: int = 15,
         user_agent: str = "Mozilla/5.0 (SundayMoviesBot)",
     ) -> None:
-        if BeautifulSoup is None:
+        self._bs4 = _load_bs4()
+        if self._bs4 is None:
             raise ImportError("BeautifulSoup (bs4) is required for AMC scraping. Install beautifulsoup4.")
+        cloudscraper = _load_cloudscraper() if session is None else None
         if session is not None:
             self.session = session
         elif cloudscraper is not None:
@@ -84,22 +112,25 @@ class AMCShowtimeCollector:
         date: dt.date,
     ) -> List[MovieSchedule]:
         """Parse AMC showtime HTML page."""
-        soup = BeautifulSoup(html, "html.parser")
-        listing_container = soup.select_one("div[data-qa='showtimes-list']")
+        # 只为排片列表子树建 Tag，跳过 head/script 等整页其余节点
+        only_listing = self._bs4.SoupStrainer("div", attrs={"data-qa": "showtimes-list"})
+        soup = self._bs4.BeautifulSoup(html, _html_parser_name(), parse_only=only_listing)
+        listing_container = soup.find("div", attrs={"data-qa": "showtimes-list"})
         if not listing_container:
             logger.warning("AMC showtime list not found", extra={"theatre": theatre_slug, "date": date})
             return []
 
-        movie_blocks = listing_container.select("div.ShowtimeCard")
-        schedules: Dict[str, List[Showtime]] = {}
+        movie_blocks = listing_container.find_all("div", class_="ShowtimeCard")
+        cinema_name = theatre_slug.replace("-", " ").title()
+        schedules: Dict[str, List[Showtime]] = defaultdict(list)
 
         for movie_block in movie_blocks:
-            title_element = movie_block.select_one("[data-qa='showtime-card-title']")
+            title_element = movie_block.find(attrs={"data-qa": "showtime-card-title"})
             if not title_element:
                 continue
             movie_title = title_element.get_text(strip=True)
 
-            for button in movie_block.select("a[data-qa='showtime-button']"):
+            for button in movie_block.find_all("a", attrs={"data-qa": "showtime-button"}):
                 # 只取直接文本节点：按钮内嵌套的 <span class="Showtime__format"> 会污染时间文本
                 time_text = "".join(button.find_all(string=True, recursive=False)).strip()
                 try:
@@ -110,20 +141,23 @@ class AMCShowtimeCollector:
 
                 booking_href = button.get("href")
                 booking_url = f"{self.BASE_URL}{booking_href}" if booking_href else None
-                format_tags = [tag.get_text(strip=True) for tag in button.select("span.Showtime__format")]
+                format_tags = intern_format_tags(
+                    tag.get_text(strip=True) for tag in button.find_all("span", class_="Showtime__format")
+                )
 
                 showtime = Showtime(
                     cinema_id=theatre_slug,
-                    cinema_name=theatre_slug.replace("-", " ").title(),
+                    cinema_name=cinema_name,
                     movie_title=movie_title,
                     start_time=start_time,
                     format_tags=format_tags,
                     booking_url=booking_url,
                 )
-                schedules.setdefault(movie_title, []).append(showtime)
+                schedules[movie_title].append(showtime)
 
+        by_start = attrgetter("start_time")
         return [
-            MovieSchedule(movie_title=title, showtimes=sorted(shows, key=lambda s: s.start_time))
+            MovieSchedule(movie_title=title, showtimes=sorted(shows, key=by_start))
             for title, shows in schedules.items()
         ]
 
@@ -131,12 +165,12 @@ class AMCShowtimeCollector:
     def _combine_date_time(date: dt.date, time_text: str) -> dt.datetime:
         """Combine ISO date with strings like '12:30 PM'."""
         normalized = time_text.replace(".", "").upper()
-        for fmt in ("%I:%M %p", "%I %p"):
-            try:
-                time_part = dt.datetime.strptime(normalized, fmt).time()
-                return dt.datetime.combine(date, time_part)
-            except ValueError:
-                continue
+        match = _TIME_RE.fullmatch(normalized)
+        if match:
+            hour, minute = int(match.group(1)), int(match.group(2) or 0)
+            if 1 <= hour <= 12 and minute < 60:
+                hour = hour % 12 + (12 if match.group(3) == "PM" else 0)
+                return dt.datetime(date.year, date.month, date.day, hour, minute)
         raise ValueError(f"Cannot parse time: {time_text}")
 
     @staticmethod
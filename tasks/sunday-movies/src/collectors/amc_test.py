@@ -69,7 +69,7 @@ class AMCShowtimeCollectorParseTests(unittest.TestCase):
         dune_schedule = next(schedule for schedule in schedules if schedule.movie_title == "Dune: Part Two")
         times = [show.start_time.strftime("%H:%M") for show in dune_schedule.showtimes]
         self.assertEqual(times, ["13:30", "16:15"])
-        self.assertEqual(dune_schedule.showtimes[0].format_tags, ["IMAX"])
+        self.assertEqual(dune_schedule.showtimes[0].format_tags, ("IMAX",))
         self.assertTrue(dune_schedule.showtimes[0].booking_url.endswith("some-id"))
 
         inside_out_schedule = next(
@@ -92,5 +92,25 @@ class AMCShowtimeCollectorParseTests(unittest.TestCase):
         self.assertTrue(all(show.cinema_id == "san-jose/amc-mercado-20" for show in flat))
 
 
+class AMCCombineDateTimeTests(unittest.TestCase):
+    def test_parses_clock_variants_like_strptime(self) -> None:
+        date = dt.date(2025, 1, 5)
+        cases = {
+            "1:30 PM": dt.datetime(2025, 1, 5, 13, 30),
+            "12:00 AM": dt.datetime(2025, 1, 5, 0, 0),
+            "12:15 p.m.": dt.datetime(2025, 1, 5, 12, 15),
+            "7 pm": dt.datetime(2025, 1, 5, 19, 0),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(AMCShowtimeCollector._combine_date_time(date, text), expected)
+
+    def test_rejects_out_of_range_or_malformed_times(self) -> None:
+        for text in ("13:00 PM", "0:30 AM", "1:60 PM", "1:30PM", "Sold Out"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    AMCShowtimeCollector._combine_date_time(dt.date(2025, 1, 5), text)
+
+
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
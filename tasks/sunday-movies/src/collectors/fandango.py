@@ -3,19 +3,120 @@
 from __future__ import annotations
 
 import datetime as dt
+import json
 import logging
-from typing import Any, Dict, Iterable, List, Optional
+import re
+from functools import lru_cache
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - optional faster JSON decoding straight from bytes
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+try:  # pragma: no cover - optional async/HTTP2 backend
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - httpx needs h2 to negotiate HTTP/2
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _HTTP2_AVAILABLE = False
 
 try:  # pragma: no cover - import shim for script usage
-    from .models import MovieSchedule, Showtime
+    from .models import MovieSchedule, Showtime, intern_format_tags
 except ImportError:  # pragma: no cover
-    from models import MovieSchedule, Showtime  # type: ignore
+    from models import MovieSchedule, Showtime, intern_format_tags  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+_CLOCK_RE = re.compile(r"\s*(\d{1,2}):(\d{2})\s*([AaPp][Mm])?\s*")
+
+
+@lru_cache(maxsize=4096)
+def _dateutil_parse(text: str) -> dt.datetime:
+    return date_parser.parse(text)
+
+
+def _parse_datetime(text: str) -> dt.datetime:
+    """Parse ISO 8601 with fromisoformat, falling back to a cached dateutil guess."""
+    try:
+        return dt.datetime.fromisoformat(text)
+    except ValueError:
+        return _dateutil_parse(text)
+
+
+def _naive_local(parsed: dt.datetime) -> dt.datetime:
+    """Convert an aware datetime to local time and drop tzinfo; naive values pass through."""
+    if parsed.tzinfo is None:
+        return parsed
+    return parsed.astimezone(None).replace(tzinfo=None)
+
+
+def _parse_clock(text: str) -> Optional[dt.time]:
+    """Parse "1:30 PM" / "13:30" directly; return None for anything else so the caller can use dateutil."""
+    match = _CLOCK_RE.fullmatch(text)
+    if not match:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3)
+    if minute > 59:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem.upper() == "PM" else 0)
+    elif hour > 23:
+        return None
+    return dt.time(hour, minute)
+
+
+@lru_cache(maxsize=128)
+def _referer_for(slug: str, iso_date: str) -> str:
+    """Build the theater-page Referer; batch fetches repeat the same slug/date pairs."""
+    return f"https://www.fandango.com/{slug}/theater-page?format=all&date={iso_date}"
+
+
+_FORMAT_FIELDS = ("attributes", "attributeCodes", "amenities", "amenityCodes")
+
+# (title first-seen index, start time, title, format_tags, booking_url, auditorium)
+_ShowRow = Tuple[int, dt.datetime, str, Tuple[str, ...], Optional[str], Optional[str]]
+_ROW_SORT_KEY = itemgetter(0, 1)
+
+
+def _assemble_schedules(rows: List[_ShowRow], theater_id: str, theater_name: str) -> List[MovieSchedule]:
+    """Sort once and group by title: titles in first-seen order, showtimes by start time."""
+    rows.sort(key=_ROW_SORT_KEY)
+    return [
+        MovieSchedule(
+            movie_title=group[0][2],
+            showtimes=[
+                Showtime(
+                    cinema_id=theater_id,
+                    cinema_name=theater_name,
+                    movie_title=title,
+                    start_time=start_time,
+                    format_tags=format_tags,
+                    booking_url=booking_url,
+                    auditorium=auditorium,
+                )
+                for _order, start_time, title, format_tags, booking_url, auditorium in group
+            ],
+        )
+        for group in (list(g) for _key, g in groupby(rows, key=itemgetter(0)))
+    ]
+
 
 class FandangoAuthError(RuntimeError):
     """Raised when Fandango blocks the request due to missing session context."""
@@ -45,11 +146,28 @@ class FandangoShowtimeCollector:
         *,
         timeout: int = 15,
     ) -> None:
-        self.session = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            adapter = self._build_adapter()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
         self.timeout = timeout
         for key, value in self.DEFAULT_HEADERS.items():
             self.session.headers.setdefault(key, value)
 
+    @staticmethod
+    def _build_adapter() -> HTTPAdapter:
+        """Pooled adapter with bounded retries on 429/5xx; 403 is an auth failure and is not retried."""
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        return HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+
     def fetch_showtimes(
         self,
         theater_id: str,
@@ -64,6 +182,74 @@ class FandangoShowtimeCollector:
         """Return grouped showtimes for a given theater and date."""
 
         iso_date = date.isoformat()
+        url, headers = self._build_request(
+            theater_id,
+            iso_date,
+            chain_code=chain_code,
+            referer_slug=referer_slug,
+            use_legacy_endpoint=use_legacy_endpoint,
+            has_referer="Referer" in self.session.headers,
+        )
+        response = self.session.get(url, timeout=self.timeout, cookies=cookies, headers=headers or None)
+        return self._handle_response(response, theater_id, theater_name, iso_date)
+
+    def create_async_client(
+        self,
+        *,
+        cookies: Optional[Dict[str, str]] = None,
+        max_connections: int = 16,
+    ) -> "httpx.AsyncClient":
+        """Build an ``httpx.AsyncClient`` for :meth:`fetch_showtimes_async`.
+
+        HTTP/2 is enabled when ``h2`` is installed so concurrent theater fetches
+        multiplex over a single connection; otherwise it falls back to pooled HTTP/1.1.
+        """
+
+        if httpx is None:
+            raise RuntimeError("httpx is required for async Fandango fetching")
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=self.DEFAULT_HEADERS,
+            cookies=cookies,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def fetch_showtimes_async(
+        self,
+        client: "httpx.AsyncClient",
+        theater_id: str,
+        theater_name: str,
+        date: dt.date,
+        *,
+        chain_code: str = "AMC",
+        referer_slug: Optional[str] = None,
+        use_legacy_endpoint: bool = False,
+    ) -> List[MovieSchedule]:
+        """Async variant of :meth:`fetch_showtimes`; cookies live on ``client``."""
+
+        iso_date = date.isoformat()
+        url, headers = self._build_request(
+            theater_id,
+            iso_date,
+            chain_code=chain_code,
+            referer_slug=referer_slug,
+            use_legacy_endpoint=use_legacy_endpoint,
+            has_referer="Referer" in client.headers,
+        )
+        response = await client.get(url, headers=headers or None)
+        return self._handle_response(response, theater_id, theater_name, iso_date)
+
+    def _build_request(
+        self,
+        theater_id: str,
+        iso_date: str,
+        *,
+        chain_code: str,
+        referer_slug: Optional[str],
+        use_legacy_endpoint: bool,
+        has_referer: bool,
+    ) -> Tuple[str, Dict[str, str]]:
         if use_legacy_endpoint:
             url = self.LEGACY_API_TEMPLATE.format(theater_id=theater_id.lower(), iso_date=iso_date)
         else:
@@ -75,24 +261,30 @@ class FandangoShowtimeCollector:
 
         headers = {}
         if referer_slug:
-            headers["Referer"] = (
-                f"https://www.fandango.com/{referer_slug}/theater-page?format=all&date={iso_date}"
-            )
-        elif "Referer" not in self.session.headers:
+            headers["Referer"] = _referer_for(referer_slug, iso_date)
+        elif not has_referer:
             headers["Referer"] = "https://www.fandango.com/"
 
-        logger.debug(
-            "Fetching Fandango showtimes",
-            extra={"url": url, "theater_id": theater_id, "chain_code": chain_code, "legacy": use_legacy_endpoint},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Fetching Fandango showtimes",
+                extra={"url": url, "theater_id": theater_id, "chain_code": chain_code, "legacy": use_legacy_endpoint},
+            )
+        return url, headers
 
-        response = self.session.get(url, timeout=self.timeout, cookies=cookies, headers=headers or None)
+    def _handle_response(
+        self,
+        response: Any,
+        theater_id: str,
+        theater_name: str,
+        iso_date: str,
+    ) -> List[MovieSchedule]:
         if response.status_code == 403:
             raise FandangoAuthError("Fandango rejected the request (HTTP 403). Provide cookies or retry manually.")
         response.raise_for_status()
 
         try:
-            payload = response.json()
+            payload = _json_loads(response.content)
         except ValueError as exc:
             raise ValueError("Unexpected non-JSON response from Fandango") from exc
 
@@ -121,7 +313,13 @@ class FandangoShowtimeCollector:
         theater_id: str,
         theater_name: str,
     ) -> List[MovieSchedule]:
-        schedules: Dict[str, List[Showtime]] = {}
+        rows: List[_ShowRow] = []
+        title_order: Dict[str, int] = {}
+        append = rows.append
+        extract_start = self._extract_showtime_datetime
+        extract_tags = self._extract_format_tags
+        extract_booking_url = self._extract_booking_url
+        extract_auditorium = self._extract_auditorium
         for date_block in groupings.get("dates", []):
             base_date = self._extract_date(date_block)
             if base_date is None:
@@ -131,27 +329,25 @@ class FandangoShowtimeCollector:
                 title = self._extract_movie_title(movie)
                 if not title:
                     continue
+                order = title_order.setdefault(title, len(title_order))
 
                 for show in movie.get("showtimes", []):
-                    start_time = self._extract_showtime_datetime(show, base_date)
+                    start_time = extract_start(show, base_date)
                     if start_time is None:
                         continue
 
-                    showtime = Showtime(
-                        cinema_id=theater_id,
-                        cinema_name=theater_name,
-                        movie_title=title,
-                        start_time=start_time,
-                        format_tags=self._extract_format_tags(show, movie),
-                        booking_url=self._extract_booking_url(show),
-                        auditorium=self._extract_auditorium(show),
+                    append(
+                        (
+                            order,
+                            start_time,
+                            title,
+                            extract_tags(show, movie),
+                            extract_booking_url(show),
+                            extract_auditorium(show),
+                        )
                     )
-                    schedules.setdefault(title, []).append(showtime)
 
-        return [
-            MovieSchedule(movie_title=title, showtimes=sorted(show_list, key=lambda s: s.start_time))
-            for title, show_list in schedules.items()
-        ]
+        return _assemble_schedules(rows, theater_id, theater_name)
 
     def _parse_view_model(
         self,
@@ -160,73 +356,60 @@ class FandangoShowtimeCollector:
         theater_name: str,
         iso_date: str,
     ) -> List[MovieSchedule]:
-        schedules: Dict[str, List[Showtime]] = {}
+        rows: List[_ShowRow] = []
+        title_order: Dict[str, int] = {}
         selected_date = view_model.get("date") or iso_date
         movies = view_model.get("movies") or []
+        append = rows.append
+        parse_ticketing_date = self._parse_ticketing_date
+        collect_tags = self._collect_view_model_tags
 
         for movie in movies:
             title = movie.get("title") or movie.get("name")
             if not title:
                 continue
+            order = title_order.setdefault(title, len(title_order))
 
             for variant in movie.get("variants") or []:
                 variant_format = variant.get("format")
                 for group in variant.get("amenityGroups") or []:
                     amenity_names = [
-                        str(amenity.get("name")).strip()
-                        for amenity in group.get("amenities") or []
-                        if amenity.get("name")
+                        str(name).strip()
+                        for name in (amenity.get("name") for amenity in group.get("amenities") or [])
+                        if name
                     ]
 
                     for show in group.get("showtimes") or []:
-                        start_time = self._parse_ticketing_date(show, selected_date)
+                        start_time = parse_ticketing_date(show, selected_date)
                         if start_time is None:
                             continue
 
-                        format_tags = self._collect_view_model_tags(
-                            variant_format,
-                            amenity_names,
-                            show.get("filmFormat") or [],
-                        )
-
-                        showtime = Showtime(
-                            cinema_id=theater_id,
-                            cinema_name=theater_name,
-                            movie_title=title,
-                            start_time=start_time,
-                            format_tags=format_tags,
-                            booking_url=show.get("ticketingJumpPageURL"),
-                            auditorium=show.get("auditorium") or show.get("auditoriumName"),
+                        get = show.get
+                        append(
+                            (
+                                order,
+                                start_time,
+                                title,
+                                collect_tags(variant_format, amenity_names, get("filmFormat") or []),
+                                get("ticketingJumpPageURL"),
+                                get("auditorium") or get("auditoriumName"),
+                            )
                         )
-                        schedules.setdefault(title, []).append(showtime)
 
-        return [
-            MovieSchedule(movie_title=title, showtimes=sorted(show_list, key=lambda s: s.start_time))
-            for title, show_list in schedules.items()
-        ]
+        return _assemble_schedules(rows, theater_id, theater_name)
 
     @staticmethod
     def _collect_view_model_tags(
         variant_format: Optional[str],
         amenity_names: Iterable[str],
         film_format: Iterable[Dict[str, Any]],
-    ) -> List[str]:
-        tags: List[str] = []
-
-        def add(tag: Optional[str]) -> None:
-            if not tag:
-                return
-            tag = str(tag).strip()
-            if tag and tag not in tags:
-                tags.append(tag)
-
-        add(variant_format)
-        for name in amenity_names:
-            add(name)
-        for fmt in film_format:
-            add(fmt.get("filterName") or fmt.get("name"))
-
-        return tags
+    ) -> Tuple[str, ...]:
+        raw = chain(
+            (variant_format,),
+            amenity_names,
+            (fmt.get("filterName") or fmt.get("name") for fmt in film_format),
+        )
+        return intern_format_tags(dict.fromkeys(tag for tag in (str(item).strip() for item in raw if item) if tag))
 
     @staticmethod
     def _parse_ticketing_date(show: Dict, selected_date: str) -> Optional[dt.datetime]:
@@ -234,20 +417,20 @@ class FandangoShowtimeCollector:
         if ticketing_date:
             normalized = ticketing_date.replace("+", " ")
             try:
-                parsed = date_parser.parse(normalized)
-                if parsed.tzinfo:
-                    return parsed.astimezone(None).replace(tzinfo=None)
-                return parsed
+                return _naive_local(_parse_datetime(normalized))
             except (ValueError, TypeError):
                 pass
 
         time_str = show.get("screenReaderTime") or show.get("date")
         if selected_date and time_str:
+            clock = _parse_clock(time_str)
+            if clock is not None:
+                try:
+                    return dt.datetime.combine(dt.date.fromisoformat(selected_date), clock)
+                except ValueError:
+                    pass
             try:
-                parsed = date_parser.parse(f"{selected_date} {time_str}")
-                if parsed.tzinfo:
-                    return parsed.astimezone(None).replace(tzinfo=None)
-                return parsed
+                return _naive_local(_parse_datetime(f"{selected_date} {time_str}"))
             except (ValueError, TypeError):
                 return None
         return None
@@ -276,7 +459,7 @@ class FandangoShowtimeCollector:
         if not date_str:
             return None
         try:
-            parsed = date_parser.parse(str(date_str))
+            parsed = _parse_datetime(str(date_str))
         except (ValueError, TypeError):
             return None
         return parsed.date()
@@ -302,10 +485,10 @@ class FandangoShowtimeCollector:
             if not candidate:
                 continue
             try:
-                parsed = date_parser.parse(str(candidate))
+                parsed = _parse_datetime(str(candidate))
                 if not parsed.tzinfo:
                     return dt.datetime.combine(base_date, parsed.time())
-                return parsed.astimezone(None).replace(tzinfo=None)
+                return _naive_local(parsed)
             except (ValueError, TypeError):
                 continue
 
@@ -313,27 +496,21 @@ class FandangoShowtimeCollector:
         time_str = show.get("time") or show.get("startTimeText")
         if not time_str:
             return None
-        try:
-            time_obj = date_parser.parse(time_str).time()
-        except (ValueError, TypeError):
-            return None
+        time_obj = _parse_clock(time_str)
+        if time_obj is None:
+            try:
+                time_obj = _dateutil_parse(time_str).time()
+            except (ValueError, TypeError):
+                return None
         return dt.datetime.combine(base_date, time_obj)
 
     @staticmethod
-    def _extract_format_tags(show: Dict, movie: Dict) -> List[str]:
-        tags: List[str] = []
-
-        for field in ("attributes", "attributeCodes", "amenities", "amenityCodes"):
-            value = show.get(field)
-            if isinstance(value, list):
-                tags.extend(str(v) for v in value if v)
-
+    def _extract_format_tags(show: Dict, movie: Dict) -> Tuple[str, ...]:
+        lists = [show.get(field) for field in _FORMAT_FIELDS]
         # Some variants list formats at the movie level
-        movie_formats = movie.get("formats") or movie.get("formatTypes")
-        if isinstance(movie_formats, list):
-            tags.extend(str(item) for item in movie_formats if item)
-
-        return sorted({tag.strip() for tag in tags if isinstance(tag, str)})
+        lists.append(movie.get("formats") or movie.get("formatTypes"))
+        raw = chain.from_iterable(value for value in lists if isinstance(value, list))
+        return intern_format_tags(sorted({tag.strip() for tag in map(str, filter(None, raw))}))
 
     @staticmethod
     def _extract_booking_url(show: Dict) -> Optional[str]:
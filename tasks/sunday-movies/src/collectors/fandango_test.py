@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import json
 import sys
@@ -30,11 +31,17 @@ VIEW_MODEL_FIXTURE_PATH = (
 
 
 class FandangoShowtimeCollectorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # 解析器只读 payload，fixture 整个类加载一次即可
+        cls.groupings_payload = json.loads(GROUPINGS_FIXTURE_PATH.read_text())
+        cls.view_model_payload = json.loads(VIEW_MODEL_FIXTURE_PATH.read_text())
+
     def setUp(self) -> None:
         self.collector = FandangoShowtimeCollector(session=requests.Session())
 
     def test_parse_groupings_into_schedules(self) -> None:
-        payload = json.loads(GROUPINGS_FIXTURE_PATH.read_text())
+        payload = self.groupings_payload
         schedules = self.collector._parse_groupings(
             payload,
             theater_id="AADYN",
@@ -47,7 +54,7 @@ class FandangoShowtimeCollectorTests(unittest.TestCase):
         dune = next(schedule for schedule in schedules if schedule.movie_title == "Dune: Part Two")
         dune_times = [show.start_time.strftime("%H:%M") for show in dune.showtimes]
         self.assertEqual(dune_times, ["13:30", "16:15"])
-        self.assertEqual(dune.showtimes[0].format_tags, ["Dolby Cinema", "IMAX", "Reserved Seating"])
+        self.assertEqual(dune.showtimes[0].format_tags, ("Dolby Cinema", "IMAX", "Reserved Seating"))
         self.assertEqual(dune.showtimes[0].auditorium, "Auditorium 5")
 
         inside_out = next(schedule for schedule in schedules if schedule.movie_title == "Inside Out 2")
@@ -58,7 +65,7 @@ class FandangoShowtimeCollectorTests(unittest.TestCase):
         )
 
     def test_flatten_schedules_returns_all_showtimes(self) -> None:
-        payload = json.loads(GROUPINGS_FIXTURE_PATH.read_text())
+        payload = self.groupings_payload
         schedules = self.collector._parse_groupings(
             payload,
             theater_id="AADYN",
@@ -70,7 +77,7 @@ class FandangoShowtimeCollectorTests(unittest.TestCase):
         self.assertTrue(all(show.cinema_id == "AADYN" for show in flat))
 
     def test_parse_view_model_payload(self) -> None:
-        payload = json.loads(VIEW_MODEL_FIXTURE_PATH.read_text())
+        payload = self.view_model_payload
         schedules = self.collector._parse_groupings(
             payload,
             theater_id="AADYN",
@@ -87,6 +94,54 @@ class FandangoShowtimeCollectorTests(unittest.TestCase):
         self.assertIn("Reserved seating", first_tags)
         self.assertIn("Dolby", first_tags)
 
+    def test_showtime_datetime_parsing_paths(self) -> None:
+        base_date = dt.date(2025, 10, 12)
+        extract = FandangoShowtimeCollector._extract_showtime_datetime
+        self.assertEqual(extract({"time": "7:05 pm"}, base_date), dt.datetime(2025, 10, 12, 19, 5))
+        self.assertEqual(extract({"startTime": "2025-10-11T09:00:00"}, base_date), dt.datetime(2025, 10, 12, 9, 0))
+        self.assertIsNone(extract({"time": "sold out"}, base_date))
+
+        ticketing = FandangoShowtimeCollector._parse_ticketing_date
+        self.assertEqual(ticketing({"ticketingDate": "2025-10-12+21:45"}, ""), dt.datetime(2025, 10, 12, 21, 45))
+        self.assertEqual(
+            ticketing({"screenReaderTime": "12:10 AM"}, "2025-10-13"),
+            dt.datetime(2025, 10, 13, 0, 10),
+        )
+
+    def test_format_tags_are_shared_tuples(self) -> None:
+        movie = {"formats": ["IMAX"]}
+        first = FandangoShowtimeCollector._extract_format_tags({"attributes": ["Reserved Seating"]}, movie)
+        second = FandangoShowtimeCollector._extract_format_tags({"amenities": ["Reserved Seating "]}, movie)
+        self.assertEqual(first, ("IMAX", "Reserved Seating"))
+        self.assertIs(first, second)
+
+    def test_fetch_showtimes_async_uses_client(self) -> None:
+        class _Response:
+            status_code = 200
+            content = GROUPINGS_FIXTURE_PATH.read_bytes()
+
+            def raise_for_status(self) -> None:
+                return None
+
+        class _Client:
+            headers: dict = {}
+
+            def __init__(self) -> None:
+                self.calls = []
+
+            async def get(self, url, headers=None):
+                self.calls.append((url, headers))
+                return _Response()
+
+        client = _Client()
+        schedules = asyncio.run(
+            self.collector.fetch_showtimes_async(client, "AADYN", "AMC Mercado 20", dt.date(2025, 10, 12))
+        )
+        self.assertEqual(len(schedules), 2)
+        url, headers = client.calls[0]
+        self.assertIn("theaterMovieShowtimes/AADYN", url)
+        self.assertEqual(headers, {"Referer": "https://www.fandango.com/"})
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import datetime as dt
-from dataclasses import dataclass, field
-from typing import List, Optional
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
+# Tag combinations (IMAX, Dolby Cinema, ...) repeat across a theater's showtimes.
+_TAG_CACHE: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
-@dataclass
+
+def intern_format_tags(tags: Iterable[str]) -> Tuple[str, ...]:
+    """Return a shared tuple of interned tags, one per distinct combination."""
+    key = tuple(tags)
+    cached = _TAG_CACHE.get(key)
+    if cached is None:
+        cached = _TAG_CACHE.setdefault(key, tuple(sys.intern(tag) for tag in key))
+    return cached
+
+
+@dataclass(slots=True)
 class Showtime:
     """Single showtime entry."""
 
@@ -15,12 +28,12 @@ class Showtime:
     cinema_name: str
     movie_title: str
     start_time: dt.datetime
-    format_tags: List[str] = field(default_factory=list)
+    format_tags: Tuple[str, ...] = ()
     booking_url: Optional[str] = None
     auditorium: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MovieSchedule:
     """Showtimes grouped by movie."""
 
@@ -4,11 +4,12 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import sys
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
 
 SCRIPT_PATH = Path(__file__).resolve()
 REPO_ROOT = SCRIPT_PATH.parents[4]
@@ -18,6 +19,7 @@ if str(COLLECTORS_DIR) not in sys.path:
     sys.path.insert(0, str(COLLECTORS_DIR))
 
 from fandango import FandangoShowtimeCollector
+from models import MovieSchedule
 
 DEFAULT_COOKIE_PATH = SUNDAY_MOVIES_ROOT / "config" / "fandango_cookies.json"
 
@@ -39,12 +41,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--theater-id",
         default="AADYN",
-        help="Fandango theater ID (e.g. AADYN for AMC Mercado 20)",
+        help="Fandango theater ID (e.g. AADYN for AMC Mercado 20); comma-separated for several theaters",
     )
     parser.add_argument(
         "--theater-name",
         default="AMC Mercado 20",
-        help="Human-friendly theater name used in logs",
+        help="Human-friendly theater name used in logs; comma-separated, matched to --theater-id by position",
     )
     parser.add_argument(
         "--date",
@@ -66,7 +68,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--referer-slug",
         default=None,
-        help="Optional theater slug for Referer header, e.g. amc-mercado-20-aadyn",
+        help="Optional theater slug for Referer header, e.g. amc-mercado-20-aadyn (single theater only)",
     )
     parser.add_argument(
         "--legacy",
@@ -86,6 +88,66 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def parse_theaters(theater_ids: str, theater_names: str) -> List[Tuple[str, str]]:
+    """Pair comma-separated IDs with names by position; missing names fall back to the ID."""
+    ids = [tid.strip() for tid in theater_ids.split(",") if tid.strip()]
+    names = [name.strip() for name in theater_names.split(",")]
+    return [(tid, names[i] if i < len(names) and names[i] else tid) for i, tid in enumerate(ids)]
+
+
+async def fetch_many(
+    collector: FandangoShowtimeCollector,
+    theaters: Sequence[Tuple[str, str]],
+    args: argparse.Namespace,
+    cookies: Dict[str, str],
+) -> List[Union[List[MovieSchedule], BaseException]]:
+    """Fetch all theaters concurrently over one client; results keep the input order."""
+    async with collector.create_async_client(cookies=cookies) as client:
+        return await asyncio.gather(
+            *[
+                collector.fetch_showtimes_async(
+                    client,
+                    tid,
+                    name,
+                    args.date,
+                    chain_code=args.chain_code,
+                    use_legacy_endpoint=args.legacy,
+                )
+                for tid, name in theaters
+            ],
+            return_exceptions=True,
+        )
+
+
+def schedules_to_payload(schedules: Iterable[MovieSchedule]) -> list:
+    return [
+        {
+            "movie": schedule.movie_title,
+            "showtimes": [
+                {
+                    "start_time": show.start_time.isoformat(),
+                    "formats": show.format_tags,
+                    "auditorium": show.auditorium,
+                    "booking_url": show.booking_url,
+                }
+                for show in schedule.showtimes
+            ],
+        }
+        for schedule in schedules
+    ]
+
+
+def print_schedules(theater_name: str, day: date, schedules: List[MovieSchedule]) -> None:
+    if not schedules:
+        print("No showtimes returned. Ensure cookies are valid or try another date.")
+        return
+
+    print(f"Showtimes for {theater_name} on {day:%Y-%m-%d}:")
+    for schedule in schedules:
+        times = ", ".join(format_time(show.start_time) for show in schedule.showtimes)
+        print(f"- {schedule.movie_title}: {times}")
+
+
 def main() -> None:
     args = parse_args()
     
@@ -95,17 +157,48 @@ def main() -> None:
     
     cookies = load_cookies(args.cookie_file)
     collector = FandangoShowtimeCollector()
+    theaters = parse_theaters(args.theater_id, args.theater_name)
+    if not theaters:
+        print("Error: --theater-id must list at least one theater")
+        return
+    if args.referer_slug and len(theaters) > 1:
+        print("Error: --referer-slug applies to a single theater; drop it or pass one --theater-id")
+        return
     
     if args.debug:
         print(f"Debug: Using theater_id={args.theater_id}, date={args.date}, legacy={args.legacy}")
         print(f"Debug: Cookies loaded: {len(cookies)} entries")
-    
+
+    if len(theaters) > 1:
+        results = asyncio.run(fetch_many(collector, theaters, args, cookies))
+        if args.raw:
+            payload = [
+                {
+                    "theater_id": tid,
+                    "theater_name": name,
+                    "error": str(result) if isinstance(result, BaseException) else None,
+                    "schedules": [] if isinstance(result, BaseException) else schedules_to_payload(result),
+                }
+                for (tid, name), result in zip(theaters, results)
+            ]
+            json.dump(payload, sys.stdout, indent=2, ensure_ascii=False)
+            print()
+            return
+        for (tid, name), result in zip(theaters, results):
+            if isinstance(result, BaseException):
+                print(f"Error fetching showtimes for {name} ({tid}): {result}")
+                continue
+            print_schedules(name, args.date, result)
+        return
+
+    theater_id, theater_name = theaters[0]
+    # Set cookies on the session once instead of merging them into every get().
+    collector.session.cookies.update(cookies)
     try:
         schedules = collector.fetch_showtimes(
-            args.theater_id,
-            args.theater_name,
+            theater_id,
+            theater_name,
             args.date,
-            cookies=cookies,
             chain_code=args.chain_code,
             referer_slug=args.referer_slug,
             use_legacy_endpoint=args.legacy,
@@ -117,33 +210,11 @@ def main() -> None:
         return
 
     if args.raw:
-        payload = [
-            {
-                "movie": schedule.movie_title,
-                "showtimes": [
-                    {
-                        "start_time": show.start_time.isoformat(),
-                        "formats": show.format_tags,
-                        "auditorium": show.auditorium,
-                        "booking_url": show.booking_url,
-                    }
-                    for show in schedule.showtimes
-                ],
-            }
-            for schedule in schedules
-        ]
-        json.dump(payload, sys.stdout, indent=2, ensure_ascii=False)
+        json.dump(schedules_to_payload(schedules), sys.stdout, indent=2, ensure_ascii=False)
         print()
         return
 
-    if not schedules:
-        print("No showtimes returned. Ensure cookies are valid or try another date.")
-        return
-
-    print(f"Showtimes for {args.theater_name} on {args.date:%Y-%m-%d}:")
-    for schedule in schedules:
-        times = ", ".join(format_time(show.start_time) for show in schedule.showtimes)
-        print(f"- {schedule.movie_title}: {times}")
+    print_schedules(theater_name, args.date, schedules)
 
 
 def format_time(value: datetime) -> str:
@@ -0,0 +1,93 @@
+"""Unit tests for the fetch_fandango_showtimes CLI helpers."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import datetime as dt
+import io
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_FILE = Path(__file__).resolve()
+_MODULE_DIR = _FILE.parent
+
+if str(_MODULE_DIR) not in sys.path:
+    sys.path.insert(0, str(_MODULE_DIR))
+
+import fetch_fandango_showtimes as cli
+
+
+class _StubCollector:
+    """Stands in for FandangoShowtimeCollector; fails for theater IDs in ``failing``."""
+
+    def __init__(self, failing: set) -> None:
+        self.failing = failing
+        self.client_cookies = None
+
+    @contextlib.asynccontextmanager
+    async def create_async_client(self, *, cookies=None):
+        self.client_cookies = cookies
+        yield object()
+
+    async def fetch_showtimes_async(self, client, theater_id, theater_name, date, **kwargs):
+        if theater_id in self.failing:
+            raise RuntimeError(f"boom {theater_id}")
+        return [f"{theater_id}:{theater_name}:{date:%Y-%m-%d}"]
+
+
+class ParseTheatersTests(unittest.TestCase):
+    def test_pairs_ids_with_names_by_position(self) -> None:
+        self.assertEqual(
+            cli.parse_theaters("AADYN, AAEAC", "AMC Mercado 20, AMC Saratoga"),
+            [("AADYN", "AMC Mercado 20"), ("AAEAC", "AMC Saratoga")],
+        )
+
+    def test_missing_or_blank_names_fall_back_to_id(self) -> None:
+        self.assertEqual(
+            cli.parse_theaters("A,B,C", "Alpha,,"),
+            [("A", "Alpha"), ("B", "B"), ("C", "C")],
+        )
+        self.assertEqual(cli.parse_theaters("A,B", "Alpha"), [("A", "Alpha"), ("B", "B")])
+
+    def test_skips_empty_id_entries(self) -> None:
+        self.assertEqual(cli.parse_theaters("A,, ,B,", "Alpha,Beta"), [("A", "Alpha"), ("B", "Beta")])
+        self.assertEqual(cli.parse_theaters(" , ", "Alpha"), [])
+
+
+class FetchManyTests(unittest.TestCase):
+    def test_one_failing_theater_does_not_drop_the_others(self) -> None:
+        collector = _StubCollector(failing={"B"})
+        args = argparse.Namespace(date=dt.date(2025, 1, 5), chain_code="AMC", legacy=False)
+        theaters = [("A", "Alpha"), ("B", "Beta"), ("C", "Gamma")]
+
+        results = asyncio.run(cli.fetch_many(collector, theaters, args, {"k": "v"}))
+
+        self.assertEqual(results[0], ["A:Alpha:2025-01-05"])
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(results[2], ["C:Gamma:2025-01-05"])
+        self.assertEqual(collector.client_cookies, {"k": "v"})
+
+
+class MainArgumentTests(unittest.TestCase):
+    def test_referer_slug_with_several_theaters_is_rejected(self) -> None:
+        argv = [
+            "fetch_fandango_showtimes.py",
+            "--theater-id", "A,B",
+            "--referer-slug", "amc-a",
+            "--cookie-file", "/nonexistent",
+        ]
+        out = io.StringIO()
+        with mock.patch.object(sys, "argv", argv), mock.patch.object(cli, "fetch_many") as fetch_many:
+            with contextlib.redirect_stdout(out):
+                cli.main()
+
+        fetch_many.assert_not_called()
+        self.assertIn("--referer-slug", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,8 +11,12 @@
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
 from pathlib import Path
 import re
+from typing import Iterator, List, Optional, Tuple
 
 
 FEW_SHOT_LEAK_MARKERS = [
@@ -24,27 +28,71 @@ FEW_SHOT_LEAK_MARKERS = [
 ]
 
 KANA_RE = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\uFF66-\uFF9D]')
+LEAK_RE = re.compile("|".join(map(re.escape, FEW_SHOT_LEAK_MARKERS)))
 
 
 def is_leak(text: str) -> bool:
-    t = text
-    for m in FEW_SHOT_LEAK_MARKERS:
-        if m in t:
-            return True
-    return False
-
-
-def count_copied_kana_lines(original_text: str, translated_text: str) -> int:
-    """统计译文中和原文完全相同且包含假名的行数。"""
-    if not original_text:
-        return 0
-    orig_set = set(ln.strip() for ln in original_text.splitlines() if ln.strip())
-    cnt = 0
-    for ln in translated_text.splitlines():
-        s = ln.strip()
-        if s and s in orig_set and KANA_RE.search(s):
-            cnt += 1
-    return cnt
+    return LEAK_RE.search(text) is not None
+
+
+def iter_txt_files(root: Path) -> Iterator[Path]:
+    """递归列出 *.txt；os.walk 基于 scandir，目录项类型不用再逐个 stat。"""
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".txt"):
+                yield Path(dirpath) / name
+
+
+def _load_line_set(path: Path) -> frozenset:
+    """按行流式读取，返回去空白后的非空行集合。"""
+    with path.open("r", encoding="utf-8", errors="ignore") as f:
+        return frozenset(s for s in (ln.strip() for ln in f) if s)
+
+
+def inspect_file(p: Path, orig_root: Path) -> Tuple[bool, Optional[int]]:
+    """返回 (是否 few-shot 泄漏, 复制原文的假名行数)；只读不删，便于放进进程池。
+
+    译文按行流式扫描一遍，泄漏检测和复制计数同时进行；命中泄漏即提前返回，
+    此时不再计数，copy_cnt 为 None（文件反正会被删除）。
+    """
+    # 映射原文路径（去掉 _bilingual 后缀）
+    stem = p.stem
+    if stem.endswith("_bilingual"):
+        orig_name = stem[:-10] + ".txt"
+    else:
+        orig_name = stem + ".txt"
+    orig_path = orig_root / orig_name
+    orig_set = _load_line_set(orig_path) if orig_path.exists() else frozenset()
+
+    copy_cnt = 0
+    with p.open("r", encoding="utf-8", errors="ignore") as f:
+        for ln in f:
+            # few-shot 泄漏标记都不跨行，逐行匹配即可
+            if LEAK_RE.search(ln):
+                return True, None
+            # 复制原文（日文）检测
+            s = ln.strip()
+            if s and s in orig_set and KANA_RE.search(s):
+                copy_cnt += 1
+    return False, copy_cnt
+
+
+def _inspect_file_safe(p: Path, orig_root: Path) -> Tuple[bool, Optional[int], Optional[str]]:
+    try:
+        leak, copy_cnt = inspect_file(p, orig_root)
+        return leak, copy_cnt, None
+    except Exception as e:
+        return False, 0, str(e)
+
+
+def inspect_files(
+    paths: List[Path], orig_root: Path, workers: Optional[int] = None
+) -> List[Tuple[bool, Optional[int], Optional[str]]]:
+    """并行检查多个文件，结果顺序与 paths 一致；workers=1 或文件太少时顺序执行。"""
+    if workers == 1 or len(paths) < 2:
+        return [_inspect_file_safe(p, orig_root) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_inspect_file_safe, paths, repeat(orig_root), chunksize=64))
 
 
 def main() -> None:
@@ -52,6 +100,7 @@ def main() -> None:
     ap.add_argument("--bilingual-dir", required=True, help="双语输出目录，如 tasks/translation/data/pixiv/50235390_bilingual")
     ap.add_argument("--original-dir", required=True, help="原文目录，如 tasks/translation/data/pixiv/50235390")
     ap.add_argument("--copy-threshold", type=int, default=10, help="判定复制原文的行数阈值（含假名且完全相同）")
+    ap.add_argument("--workers", type=int, default=0, help="并行检查的进程数（0=CPU 核数，1=顺序执行）")
     ap.add_argument("--dry-run", action="store_true", help="仅打印将删除的文件，不实际删除")
     args = ap.parse_args()
 
@@ -67,43 +116,29 @@ def main() -> None:
     checked = 0
     deleted = 0
 
-    for p in bi_root.rglob("*.txt"):
-        try:
-            checked += 1
-            bi_text = p.read_text(encoding="utf-8", errors="ignore")
-            # few-shot 泄漏检测
-            leak = is_leak(bi_text)
-
-            # 映射原文路径（去掉 _bilingual 后缀）
-            stem = p.stem
-            if stem.endswith("_bilingual"):
-                orig_name = stem[:-10] + ".txt"
+    paths = list(iter_txt_files(bi_root))
+    results = inspect_files(paths, orig_root, workers=args.workers or None)
+
+    # 删除只在主进程按结果顺序执行，worker 只负责检查
+    for p, (leak, copy_cnt, error) in zip(paths, results):
+        checked += 1
+        if error is not None:
+            print(f"WARN 处理失败 {p}: {error}")
+            continue
+        if leak or copy_cnt >= args.copy_threshold:
+            reason = "leak=True" if leak else f"copy_cnt={copy_cnt}"
+            if args.dry_run:
+                print(f"DRY-RUN DELETE {p} ({reason})")
             else:
-                orig_name = stem + ".txt"
-            orig_path = orig_root / orig_name
-            orig_text = ""
-            if orig_path.exists():
-                orig_text = orig_path.read_text(encoding="utf-8", errors="ignore")
-
-            # 复制原文（日文）检测
-            copy_cnt = count_copied_kana_lines(orig_text, bi_text) if orig_text else 0
-
-            if leak or copy_cnt >= args.copy_threshold:
-                if args.dry_run:
-                    print(f"DRY-RUN DELETE {p} (leak={leak}, copy_cnt={copy_cnt})")
-                else:
-                    try:
-                        p.unlink()
-                        deleted += 1
-                        print(f"DELETE {p} (leak={leak}, copy_cnt={copy_cnt})")
-                    except Exception as e:
-                        print(f"WARN 删除失败 {p}: {e}")
-        except Exception as e:
-            print(f"WARN 处理失败 {p}: {e}")
+                try:
+                    p.unlink()
+                    deleted += 1
+                    print(f"DELETE {p} ({reason})")
+                except Exception as e:
+                    print(f"WARN 删除失败 {p}: {e}")
 
     print(f"Summary: checked={checked}, deleted={deleted}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -216,7 +216,7 @@ def format_line_spans(numbers: List[int]) -> str:
 
 def parse_args() -> argparse.Namespace:
     raw_argv = sys.argv[1:]
-    preset_parser = argparse.ArgumentParser(add_help=False)
+    preset_parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
     preset_parser.add_argument("--preset")
     preset_parser.add_argument("--presets-file")
     preset_args, _ = preset_parser.parse_known_args(raw_argv)
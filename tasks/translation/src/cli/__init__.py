@@ -4,20 +4,22 @@
 """
 
 import argparse
+import os
 from pathlib import Path
 from typing import List
 
-try:
-    from ..core.config import TranslationConfig
-except ImportError as exc:  # unittest discover may import this package as top-level "cli".
-    if "attempted relative import" not in str(exc):
-        raise
-    from core.config import TranslationConfig
+# 从 src/cli/ 回到 translation/；默认提示资产路径只在导入时计算一次
+_BASE_DIR = Path(__file__).resolve().parent.parent.parent
+_DATA_DIR = _BASE_DIR / "data"
+_SAMPLES_DIR = _DATA_DIR / "samples"
+_PROMPT_STYLES_DIR = _DATA_DIR / "prompt_styles"
+_DEFAULT_PRESETS_PATH = _BASE_DIR / "config" / "presets.json"
+_DEFAULT_STOP = ("（未完待续）", "[END]", "<|im_end|>", "</s>")
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
     """创建命令行参数解析器"""
-    parser = argparse.ArgumentParser(description="批量翻译文本到双语/中文输出")
+    parser = argparse.ArgumentParser(description="批量翻译文本到双语/中文输出", allow_abbrev=False)
     
     # 模型配置
     parser.add_argument("--model", default="Qwen/Qwen3-32B", help="使用的模型名称")
@@ -50,6 +52,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
     # 质量检测配置
     parser.add_argument("--no-llm-check", action="store_true", help="禁用LLM质量检测（旧标志）")
     parser.add_argument("--disable-llm-qc", action="store_true", help="等同于 --no-llm-check，用于显式关闭 LLM 质检")
+    parser.add_argument("--no-qc-cache", dest="qc_cache", action="store_false", help="不读写 LLM 质检结果缓存（log_dir/qc_cache.sqlite）")
     parser.add_argument("--strict-repetition-check", action="store_true", help="启用严格重复检测")
     parser.add_argument("--qa-report", action="store_true", help="翻译/修复完成后生成硬规则 QA 报告")
     parser.add_argument("--qa-report-dir", type=Path, default=None, help="QA 报告输出目录，默认写到 log_dir/qa_reports")
@@ -116,7 +119,7 @@ def create_argument_parser() -> argparse.ArgumentParser:
     )
     
     # 生成参数
-    parser.add_argument("--stop", nargs="*", default=["（未完待续）", "[END]", "<|im_end|>", "</s>"], help="停止词")
+    parser.add_argument("--stop", nargs="*", default=_DEFAULT_STOP, help="停止词")
     parser.add_argument("--frequency-penalty", type=float, default=0.3, help="频率惩罚")
     parser.add_argument("--presence-penalty", type=float, default=0.2, help="存在惩罚")
     parser.add_argument(
@@ -176,17 +179,17 @@ def validate_args(args: argparse.Namespace) -> List[str]:
         errors.append("retry_wait 不能为负数")
     
     # 检查文件路径
-    if args.terminology_file and not args.terminology_file.exists():
+    if args.terminology_file and not os.path.exists(args.terminology_file):
         errors.append(f"术语文件不存在: {args.terminology_file}")
     
-    if args.sample_file and not args.sample_file.exists():
+    if args.sample_file and not os.path.exists(args.sample_file):
         errors.append(f"示例文件不存在: {args.sample_file}")
     
-    if args.preface_file and not args.preface_file.exists():
+    if args.preface_file and not os.path.exists(args.preface_file):
         errors.append(f"前言文件不存在: {args.preface_file}")
-    if args.profiles_file and not args.profiles_file.exists():
+    if args.profiles_file and not os.path.exists(args.profiles_file):
         errors.append(f"profiles 文件不存在: {args.profiles_file}")
-    if args.name_glossary_file and not args.name_glossary_file.exists():
+    if args.name_glossary_file and not os.path.exists(args.name_glossary_file):
         errors.append(f"人名译名表不存在: {args.name_glossary_file}")
     
     return errors
@@ -194,12 +197,10 @@ def validate_args(args: argparse.Namespace) -> List[str]:
 
 def setup_default_paths(args: argparse.Namespace) -> None:
     """设置默认文件路径"""
-    base_dir = Path(__file__).parent.parent.parent  # 从 src/cli/ 回到 translation/
-    prompt_styles_dir = base_dir / "data" / "prompt_styles"
     style_name = getattr(args, "prompt_style", None) or "default"
-    style_dir = prompt_styles_dir / style_name
+    style_dir = _PROMPT_STYLES_DIR / style_name
     if not style_dir.exists():
-        style_dir = prompt_styles_dir / "default"
+        style_dir = _PROMPT_STYLES_DIR / "default"
         style_name = "default"
     args.prompt_style = style_name
 
@@ -211,47 +212,43 @@ def setup_default_paths(args: argparse.Namespace) -> None:
                 setattr(args, attr, path)
                 return
 
-    data_dir = base_dir / "data"
-    samples_dir = data_dir / "samples"
-
     if style_name == "default":
         if args.enable_terminology:
-            pick_path("terminology_file", [data_dir / "terminology.txt"])
-        pick_path("sample_file", [samples_dir / "sample.txt"])
-        pick_path("preface_file", [data_dir / "preface.txt"])
-        pick_path("preface_yaml_file", [data_dir / "preface_yaml.txt"])
-        pick_path("preface_body_file", [data_dir / "preface_body.txt"])
-        pick_path("sample_yaml_file", [samples_dir / "sample_yaml.txt"])
+            pick_path("terminology_file", [_DATA_DIR / "terminology.txt"])
+        pick_path("sample_file", [_SAMPLES_DIR / "sample.txt"])
+        pick_path("preface_file", [_DATA_DIR / "preface.txt"])
+        pick_path("preface_yaml_file", [_DATA_DIR / "preface_yaml.txt"])
+        pick_path("preface_body_file", [_DATA_DIR / "preface_body.txt"])
+        pick_path("sample_yaml_file", [_SAMPLES_DIR / "sample_yaml.txt"])
     else:
         if args.enable_terminology:
             pick_path("terminology_file", [
                 style_dir / "terminology.txt",
-                data_dir / "terminology.txt",
+                _DATA_DIR / "terminology.txt",
             ])
         pick_path("sample_file", [
             style_dir / "sample.txt",
-            samples_dir / "sample.txt",
+            _SAMPLES_DIR / "sample.txt",
         ])
         pick_path("preface_file", [
             style_dir / "preface.txt",
-            data_dir / "preface.txt",
+            _DATA_DIR / "preface.txt",
         ])
         pick_path("preface_yaml_file", [
             style_dir / "preface_yaml.txt",
-            data_dir / "preface_yaml.txt",
+            _DATA_DIR / "preface_yaml.txt",
         ])
         pick_path("preface_body_file", [
             style_dir / "preface_body.txt",
-            data_dir / "preface_body.txt",
+            _DATA_DIR / "preface_body.txt",
         ])
         pick_path("sample_yaml_file", [
             style_dir / "sample_yaml.txt",
-            samples_dir / "sample_yaml.txt",
+            _SAMPLES_DIR / "sample_yaml.txt",
         ])
     if not getattr(args, "presets_file", None):
-        presets_path = base_dir / "config" / "presets.json"
-        if presets_path.exists():
-            args.presets_file = presets_path
+        if _DEFAULT_PRESETS_PATH.exists():
+            args.presets_file = _DEFAULT_PRESETS_PATH
     if not args.enable_terminology:
         args.terminology_file = None
     # 示例可选：不强制存在
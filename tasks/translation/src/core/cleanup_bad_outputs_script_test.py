@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for the bad-output cleanup helper script."""
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[2] / "scripts" / "cleanup_bad_outputs.py"
+SPEC = importlib.util.spec_from_file_location("cleanup_bad_outputs", SCRIPT_PATH)
+assert SPEC and SPEC.loader
+cleanup_bad_outputs = importlib.util.module_from_spec(SPEC)
+sys.modules[SPEC.name] = cleanup_bad_outputs
+SPEC.loader.exec_module(cleanup_bad_outputs)
+
+
+class CleanupBadOutputsScriptTest(unittest.TestCase):
+    def test_is_leak_matches_any_marker(self) -> None:
+        self.assertTrue(cleanup_bad_outputs.is_leak("前文\n放課後、体育館裏で\n后文"))
+        self.assertFalse(cleanup_bad_outputs.is_leak("普通的译文内容"))
+
+    def test_iter_txt_files_recurses(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "sub").mkdir()
+            (root / "a.txt").write_text("", encoding="utf-8")
+            (root / "sub" / "b.txt").write_text("", encoding="utf-8")
+            (root / "sub" / "c.json").write_text("", encoding="utf-8")
+            found = sorted(p.relative_to(root).as_posix() for p in cleanup_bad_outputs.iter_txt_files(root))
+            self.assertEqual(found, ["a.txt", "sub/b.txt"])
+
+    def test_inspect_files_keeps_order_in_parallel(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            bi_root = Path(tmp) / "bi"
+            orig_root = Path(tmp) / "orig"
+            bi_root.mkdir()
+            orig_root.mkdir()
+            (orig_root / "1.txt").write_text("こんにちは\nさようなら\n", encoding="utf-8")
+            paths = [bi_root / "1_bilingual.txt", bi_root / "2_bilingual.txt", bi_root / "3_bilingual.txt"]
+            paths[0].write_text("こんにちは\n你好\nさようなら\n", encoding="utf-8")
+            paths[1].write_text("放課後、体育館裏で\n", encoding="utf-8")
+            paths[2].write_text("普通的译文\n", encoding="utf-8")
+            expected = [(False, 2, None), (True, None, None), (False, 0, None)]
+            # 本测试按文件路径加载脚本，spawn 启动方式（macOS 默认）下子进程无法按模块名反序列化 worker；
+            # 换成线程池只验证分发与结果顺序，进程池本身交给标准库
+            with patch.object(cleanup_bad_outputs, "ProcessPoolExecutor", ThreadPoolExecutor):
+                self.assertEqual(cleanup_bad_outputs.inspect_files(paths, orig_root, workers=2), expected)
+            self.assertEqual(cleanup_bad_outputs.inspect_files(paths, orig_root, workers=1), expected)
+
+    def test_inspect_file_stops_at_first_leak_line(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "1.txt").write_text("こんにちは\nさようなら\n", encoding="utf-8")
+            path = root / "1_bilingual.txt"
+            path.write_text("こんにちは\n体育館裏\nさようなら\n", encoding="utf-8")
+            self.assertEqual(cleanup_bad_outputs.inspect_file(path, root), (True, None))
+            path.write_text("こんにちは\n你好\nさようなら", encoding="utf-8")
+            self.assertEqual(cleanup_bad_outputs.inspect_file(path, root), (False, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,18 +3,74 @@
 翻译配置管理模块
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 import argparse
 import os
 import json
 from urllib.parse import urlparse
 
 
-@dataclass
+# (is_awq, bilingual_simple) -> 输出文件后缀
+_OUTPUT_SUFFIXES = {
+    (False, False): "_zh",
+    (True, False): "_awq_zh",
+    (False, True): "_bilingual",
+    (True, True): "_awq_bilingual",
+}
+# (is_32b, is_awq) -> 未显式配置时的默认上下文长度
+_DEFAULT_CONTEXT_LENGTHS = {
+    (True, False): 32768,
+}
+_FALLBACK_CONTEXT_LENGTH = 40960
+
+
+# 与配置字段同名、原样透传的 CLI 参数；Namespace 中缺失时沿用 dataclass 默认值
+_PASSTHROUGH_ARGS = (
+    "model", "temperature", "max_tokens", "max_context_length",
+    "bilingual_simple", "line_batch_size_lines", "context_lines",
+    "retries", "retry_wait", "fallback_on_context",
+    "repair_existing", "repair_from_qa_report_dir",
+    "qc_cache", "strict_repetition_check", "qa_report", "qa_report_dir", "qa_fail_on_error",
+    "overwrite", "profiles_file", "terminology_file", "sample_file", "preface_file",
+    "preface_yaml_file", "sample_yaml_file", "preface_body_file", "sample_body_file",
+    "prompt_style", "stop", "frequency_penalty", "presence_penalty", "token_estimator",
+    "realtime_log", "debug", "limit", "offset", "sort_by_length",
+    "max_retries", "metadata_only",
+    "enable_name_glossary", "name_glossary_file", "name_glossary_output_dir",
+    "name_glossary_max_chars", "name_glossary_model", "name_glossary_llm_provider",
+    "name_glossary_llm_base_url", "name_glossary_llm_api_key",
+)
+# CLI 参数名 -> 配置字段名（二者不同名时）
+_RENAMED_ARGS = {
+    "article_timeout": "article_timeout_s",
+    "request_timeout": "request_timeout_s",
+    "retry_delay": "retry_delay_s",
+}
+
+# validate() 的固定错误文案
+_ERR_TEMPERATURE = "temperature 必须在 0-2 之间"
+_ERR_RETRIES = "retries 不能为负数"
+_ERR_RETRY_WAIT = "retry_wait 不能为负数"
+_ERR_NAME_GLOSSARY_MAX_CHARS = "name_glossary_max_chars 必须为正数"
+
+
+
+@lru_cache(maxsize=16)
+def _model_traits(model: str) -> Tuple[bool, bool]:
+    """按模型名分类一次：(is_32b, is_awq)。按名称缓存，model 字段被改写也不会失效。"""
+    return "32B" in model, "AWQ" in model
+
+
+@dataclass(slots=True)
 class TranslationConfig:
-    """翻译配置类，集中管理核心配置参数"""
+    """翻译配置类，集中管理核心配置参数
+
+    使用 ``slots=True``：实例无 ``__dict__``，不能再临时挂未声明的属性。
+    未冻结（frozen），流水线运行期会就地调整 retries / qa_report 等字段。
+    """
     
     # 模型配置
     model: str = "Qwen/Qwen3-32B"
@@ -33,6 +89,7 @@ class TranslationConfig:
     fallback_on_context: bool = True
     repair_existing: bool = False
     repair_from_qa_report_dir: Optional[Path] = None
+    repair_context_lines: Optional[int] = None
     
     # 质量检测配置
     no_llm_check: bool = False
@@ -42,6 +99,8 @@ class TranslationConfig:
     qa_fail_on_error: bool = False
     # 质量检测最大生成；<=0 表示不限制（交由模型/服务端按上下文决定）
     quality_max_tokens: int = 0
+    # 相同模型/提示/生成参数的 LLM 质检结果持久化到 log_dir/qc_cache.sqlite，重跑时直接复用
+    qc_cache: bool = True
     
     # 文件配置
     overwrite: bool = False
@@ -66,9 +125,7 @@ class TranslationConfig:
     presence_penalty: float = 0.2
     repetition_penalty: float = 1.1
     no_repeat_ngram_size: int = 8
-    stop: List[str] = field(default_factory=lambda: [
-        "（未完待续）", "[END]", "<|im_end|>", "</s>"
-    ])
+    stop: Sequence[str] = ("（未完待续）", "[END]", "<|im_end|>", "</s>")
     token_estimator: str = "auto"
     
     # 日志配置
@@ -156,8 +213,9 @@ class TranslationConfig:
             # 其它 provider（vllm/ollama）不需要 API key
             return None
 
-        provider_via_cli = getattr(args, 'llm_provider', None) or env_provider or 'openrouter'
-        explicit_base_url = getattr(args, 'llm_base_url', None)
+        d = vars(args)
+        provider_via_cli = d.get("llm_provider") or env_provider or 'openrouter'
+        explicit_base_url = d.get("llm_base_url")
         # 避免 LLM_BASE_URL 污染显式/默认 provider。例如 openrouter 不应误连 localhost:11434。
         base_url = explicit_base_url
         if not base_url and env_base_url and env_provider and env_provider.lower() == str(provider_via_cli).lower():
@@ -167,63 +225,20 @@ class TranslationConfig:
         if not env_api_key:
             config_api_key = cls._read_api_key_from_config(provider=provider_via_cli)
 
-        return cls(
-            model=args.model,
-            temperature=args.temperature,
-            max_tokens=args.max_tokens,
-            max_context_length=args.max_context_length,
-            bilingual_simple=getattr(args, 'bilingual_simple', False),
-            line_batch_size_lines=getattr(args, 'line_batch_size_lines', 20),
-            context_lines=getattr(args, 'context_lines', 3),
-            retries=args.retries,
-            retry_wait=args.retry_wait,
-            fallback_on_context=args.fallback_on_context,
-            repair_existing=getattr(args, "repair_existing", False),
-            repair_from_qa_report_dir=getattr(args, "repair_from_qa_report_dir", None),
-            no_llm_check=args.no_llm_check or getattr(args, "disable_llm_qc", False),
-            strict_repetition_check=args.strict_repetition_check,
-            qa_report=getattr(args, 'qa_report', False),
-            qa_report_dir=getattr(args, 'qa_report_dir', None),
-            qa_fail_on_error=getattr(args, 'qa_fail_on_error', False),
-            overwrite=args.overwrite,
-            log_dir=Path(args.log_dir),
-            profiles_file=getattr(args, 'profiles_file', None),
-            terminology_file=args.terminology_file if hasattr(args, 'terminology_file') else None,
-            sample_file=args.sample_file if hasattr(args, 'sample_file') else None,
-            preface_file=args.preface_file if hasattr(args, 'preface_file') else None,
-            preface_yaml_file=getattr(args, 'preface_yaml_file', None),
-            sample_yaml_file=getattr(args, 'sample_yaml_file', None),
-            preface_body_file=getattr(args, 'preface_body_file', None),
-            sample_body_file=getattr(args, 'sample_body_file', None),
-            prompt_style=getattr(args, 'prompt_style', 'default'),
-            stop=args.stop,
-            frequency_penalty=args.frequency_penalty,
-            presence_penalty=args.presence_penalty,
-            token_estimator=getattr(args, "token_estimator", "auto"),
-            realtime_log=args.realtime_log,
-            debug=getattr(args, 'debug', False),
-            debug_files=getattr(args, 'debug_files', False) or getattr(args, 'debug', False),  # 新标志或旧标志
-            log_level=getattr(args, 'log_level', 'DEBUG' if getattr(args, 'debug', False) else 'INFO'),  # 如果使用旧debug标志则设为DEBUG，否则使用新参数
-            limit=args.limit,
-            offset=args.offset,
-            sort_by_length=getattr(args, 'sort_by_length', False),
-            article_timeout_s=getattr(args, 'article_timeout_s', 3600),
-            request_timeout_s=getattr(args, 'request_timeout_s', 300),
-            max_retries=getattr(args, 'max_retries', 3),
-            retry_delay_s=getattr(args, 'retry_delay_s', 2.0),
-            metadata_only=getattr(args, 'metadata_only', False),
-            enable_name_glossary=getattr(args, 'enable_name_glossary', False),
-            name_glossary_file=getattr(args, 'name_glossary_file', None),
-            name_glossary_output_dir=getattr(args, 'name_glossary_output_dir', None),
-            name_glossary_max_chars=getattr(args, 'name_glossary_max_chars', 120000),
-            name_glossary_model=getattr(args, 'name_glossary_model', None),
-            name_glossary_llm_provider=getattr(args, 'name_glossary_llm_provider', None),
-            name_glossary_llm_base_url=getattr(args, 'name_glossary_llm_base_url', None),
-            name_glossary_llm_api_key=getattr(args, 'name_glossary_llm_api_key', None),
+        kwargs: Dict[str, Any] = {key: d[key] for key in _PASSTHROUGH_ARGS if key in d}
+        kwargs.update({field_name: d[arg] for arg, field_name in _RENAMED_ARGS.items() if arg in d})
+        debug = d.get("debug", False)
+        kwargs.update(
+            no_llm_check=d.get("no_llm_check", False) or d.get("disable_llm_qc", False),
+            debug_files=d.get("debug_files", False) or debug,  # 新标志或旧标志
+            log_level=d.get("log_level") or ("DEBUG" if debug else "INFO"),  # 旧 debug 标志对应 DEBUG
             llm_provider=provider_via_cli or 'openrouter',
             llm_base_url=base_url,
-            llm_api_key=getattr(args, 'llm_api_key', None) or env_api_key or config_api_key,
+            llm_api_key=d.get("llm_api_key") or env_api_key or config_api_key,
         )
+        if "log_dir" in d:
+            kwargs["log_dir"] = Path(d["log_dir"])
+        return cls(**kwargs)
     
     def get_max_context_length(self) -> int:
         """获取模型的最大上下文长度"""
@@ -231,31 +246,35 @@ class TranslationConfig:
             return self.max_context_length
         
         # 根据模型名称自动推断
-        if "32B" in self.model and "AWQ" not in self.model:
-            return 32768
-        else:
-            return 40960
+        return _DEFAULT_CONTEXT_LENGTHS.get(_model_traits(self.model), _FALLBACK_CONTEXT_LENGTH)
     
     def get_output_suffix(self) -> str:
         """获取输出文件后缀"""
-        is_awq = "AWQ" in self.model
-        if self.bilingual_simple:
-            return "_awq_bilingual" if is_awq else "_bilingual"
-        else:
-            return "_awq_zh" if is_awq else "_zh"
+        _, is_awq = _model_traits(self.model)
+        return _OUTPUT_SUFFIXES[(is_awq, bool(self.bilingual_simple))]
     
     def validate(self) -> List[str]:
         """验证配置参数，返回错误列表"""
+        if (
+            0 <= self.temperature <= 2
+            and self.retries >= 0
+            and self.retry_wait >= 0
+            and self.name_glossary_max_chars > 0
+            and not self.llm_base_url
+            and not self.name_glossary_llm_base_url
+        ):
+            return []
+
         errors = []
         
         if self.temperature < 0 or self.temperature > 2:
-            errors.append("temperature 必须在 0-2 之间")
+            errors.append(_ERR_TEMPERATURE)
         
         if self.retries < 0:
-            errors.append("retries 不能为负数")
+            errors.append(_ERR_RETRIES)
         
         if self.retry_wait < 0:
-            errors.append("retry_wait 不能为负数")
+            errors.append(_ERR_RETRY_WAIT)
 
         def validate_provider_url(provider_value: Optional[str], base_url_value: Optional[str], label: str) -> None:
             provider = (provider_value or "").lower()
@@ -283,6 +302,6 @@ class TranslationConfig:
         )
 
         if self.name_glossary_max_chars <= 0:
-            errors.append("name_glossary_max_chars 必须为正数")
+            errors.append(_ERR_NAME_GLOSSARY_MAX_CHARS)
         
         return errors
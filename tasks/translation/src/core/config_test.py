@@ -75,6 +75,29 @@ class TranslationConfigProviderTest(unittest.TestCase):
         )
         self.assertTrue(any("name_glossary_llm_provider" in error for error in config.validate()))
 
+    def test_from_args_maps_timeout_flags_to_config_fields(self):
+        args = self.parse_args(["--article-timeout", "10", "--request-timeout", "5", "--retry-delay", "0.5"])
+        with patch.dict(os.environ, {}, clear=True):
+            config = TranslationConfig.from_args(args)
+        self.assertEqual(config.article_timeout_s, 10)
+        self.assertEqual(config.request_timeout_s, 5)
+        self.assertEqual(config.retry_delay_s, 0.5)
+
+    def test_model_name_drives_output_suffix_and_context_length(self):
+        cases = [
+            ("Qwen/Qwen3-32B", False, "_zh", 32768),
+            ("Qwen/Qwen3-32B", True, "_bilingual", 32768),
+            ("Qwen/Qwen3-32B-AWQ", False, "_awq_zh", 40960),
+            ("Qwen/Qwen3-32B-AWQ", True, "_awq_bilingual", 40960),
+        ]
+        for model, bilingual, suffix, context in cases:
+            config = TranslationConfig(model=model, bilingual_simple=bilingual)
+            self.assertEqual(config.get_output_suffix(), suffix)
+            self.assertEqual(config.get_max_context_length(), context)
+        config = TranslationConfig(model="Qwen/Qwen3-32B")
+        config.model = "Qwen/Qwen3-32B-AWQ"
+        self.assertEqual(config.get_output_suffix(), "_awq_zh")
+
 
 if __name__ == "__main__":
     unittest.main()
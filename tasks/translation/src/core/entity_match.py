@@ -17,13 +17,11 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # 片假名 → 平假名(U+30A1..U+30F6 → 平假名),其余字符原样。
 _KATA_START, _KATA_END, _OFFSET = 0x30A1, 0x30F6, 0x60
+_KATA_TO_HIRA = {cp: cp - _OFFSET for cp in range(_KATA_START, _KATA_END + 1)}
 
 
 def normalize_kana(text: str) -> str:
-    return "".join(
-        chr(ord(ch) - _OFFSET) if _KATA_START <= ord(ch) <= _KATA_END else ch
-        for ch in (text or "")
-    )
+    return (text or "").translate(_KATA_TO_HIRA)
 
 
 def _surface_forms(entity: Dict[str, Any]) -> List[str]:
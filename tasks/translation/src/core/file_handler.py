@@ -4,6 +4,7 @@
 """
 
 import glob
+import os
 import re
 import yaml
 from pathlib import Path
@@ -16,6 +17,8 @@ from .run_state import OutputInspection, TranslationStateStore
 from .task import TranslationTask
 from ..utils.file import parse_yaml_front_matter
 
+_DIGIT_RUN_RE = re.compile(r"(\d+)")
+
 
 class FileHandler:
     """文件处理类"""
@@ -39,23 +42,34 @@ class FileHandler:
         self.logger = logger
         self.quality_checker = quality_checker
         self.state_store = state_store
+        # 单次 plan_tasks 内的目录列表缓存：同一目录的兄弟候选路径只 listdir 一次
+        self._dir_names_cache: Dict[Path, frozenset] = {}
     
     def _natural_sort_key(self, filename: str) -> List:
         """自然排序键函数，正确处理数字"""
-        # 将文件名分割为数字和非数字部分
-        parts = re.split(r'(\d+)', filename)
-        # 将数字部分转换为整数，非数字部分保持字符串
-        return [int(part) if part.isdigit() else part for part in parts]
+        # 带捕获组的 split 让数字段恰好落在奇数下标
+        parts = _DIGIT_RUN_RE.split(filename)
+        return [int(part) if i & 1 else part for i, part in enumerate(parts)]
     
     def _get_file_length(self, file_path: Path) -> int:
-        """获取文件长度（字符数）"""
+        """获取文件长度（字节数）。只用作排序键，同语种语料下与字符数同序，免去整文件读取"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return len(content)
-        except Exception:
+            return file_path.stat().st_size
+        except OSError:
             return 0
 
+    def _sibling_exists(self, path: Path) -> bool:
+        """用缓存的目录列表判断路径是否存在，代替逐个 stat。"""
+        directory = path.parent
+        names = self._dir_names_cache.get(directory)
+        if names is None:
+            try:
+                names = frozenset(os.listdir(directory))
+            except OSError:
+                names = frozenset()
+            self._dir_names_cache[directory] = names
+        return path.name in names
+
     def _looks_like_bilingual_file(self, file_path: Path) -> bool:
         """判断文件是否为双语产物（含 _bilingual/_bilingual_fixed 等）。"""
         markers = ("_bilingual", "_bilingual_fixed", "_awq_bilingual", "_awq_bilingual_fixed")
@@ -104,7 +118,7 @@ class FileHandler:
         candidates.append(parent / f"{stem}_awq_bilingual.txt")
         candidates.append(parent / f"{stem}_awq_bilingual_fixed.txt")
         for candidate in candidates:
-            if candidate and candidate.exists():
+            if self._sibling_exists(candidate):
                 return candidate
         return None
 
@@ -128,7 +142,7 @@ class FileHandler:
         if stem.endswith("_awq_bilingual"):
             candidates.append(parent / f"{stem[: -len('_awq_bilingual')]}.txt")
         for candidate in candidates:
-            if candidate.exists():
+            if self._sibling_exists(candidate):
                 return candidate
         return None
 
@@ -366,22 +380,21 @@ class FileHandler:
     
     def plan_tasks(self, inputs: List[str]) -> List[TranslationTask]:
         """根据输入路径规划翻译/修复任务。"""
+        self._dir_names_cache = {}
         files: List[Path] = []
         for input_path in inputs:
             path = Path(input_path)
             if path.is_file():
                 files.append(path)
             elif path.is_dir():
-                txt_files = sorted(path.glob("*.txt"), key=lambda x: self._natural_sort_key(x.name))
-                files.extend(txt_files)
+                with os.scandir(path) as entries:
+                    txt_names = [e.name for e in entries if e.name.endswith(".txt") and e.is_file()]
+                files.extend(path / name for name in sorted(txt_names, key=self._natural_sort_key))
             else:
-                glob_files = glob.glob(input_path)
-                files.extend([Path(f) for f in glob_files if Path(f).is_file()])
+                files.extend(p for p in map(Path, glob.iglob(input_path)) if p.is_file())
 
         filtered_items: List[Tuple[Path, str]] = []
         for file_path in files:
-            if not file_path.is_file():
-                continue
             if self._looks_like_bilingual_file(file_path):
                 # 双语产物只在显式修复模式下进入 repair;普通翻译误指向时跳过而非静默改写
                 if self.config.repair_existing:
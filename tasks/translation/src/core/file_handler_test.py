@@ -108,6 +108,65 @@ class TestFileHandlerPartialBilingualRegression(unittest.TestCase):
                 task.output_path,
             )
 
+    def test_plan_tasks_orders_directory_inputs_naturally(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "50235390"
+            source_dir.mkdir()
+            for name in ("10.txt", "2.txt", "s1_9.txt", "1.txt"):
+                (source_dir / name).write_text("原文A\n", encoding="utf-8")
+
+            handler = FileHandler(
+                TranslationConfig(),
+                UnifiedLogger.create_console_only(),
+                quality_checker=None,
+            )
+
+            tasks = handler.plan_tasks([str(source_dir)])
+
+            self.assertEqual(
+                ["1.txt", "2.txt", "10.txt", "s1_9.txt"],
+                [task.original_path.name for task in tasks],
+            )
+
+    def test_plan_tasks_sort_by_length_puts_longest_first(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "50235390"
+            source_dir.mkdir()
+            for name, repeat in (("1.txt", 1), ("2.txt", 30), ("3.txt", 5)):
+                (source_dir / name).write_text("原文A\n" * repeat, encoding="utf-8")
+
+            handler = FileHandler(
+                TranslationConfig(sort_by_length=True),
+                UnifiedLogger.create_console_only(),
+                quality_checker=None,
+            )
+
+            tasks = handler.plan_tasks([str(source_dir)])
+
+            self.assertEqual(["2.txt", "3.txt", "1.txt"], [task.original_path.name for task in tasks])
+
+    def test_plan_tasks_resolves_same_dir_bilingual_for_many_originals(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_dir = Path(tmpdir) / "pixiv" / "50235390"
+            source_dir.mkdir(parents=True)
+            for stem in ("1", "2", "3"):
+                (source_dir / f"{stem}.txt").write_text("原文A\n", encoding="utf-8")
+            (source_dir / "1_bilingual.txt").write_text("原文A\n译文A\n", encoding="utf-8")
+            (source_dir / "3_awq_bilingual.txt").write_text("原文A\n译文A\n", encoding="utf-8")
+
+            handler = FileHandler(
+                TranslationConfig(repair_existing=True),
+                UnifiedLogger.create_console_only(),
+                quality_checker=None,
+            )
+
+            tasks = handler.plan_tasks([str(source_dir / f"{stem}.txt") for stem in ("1", "2", "3")])
+
+            self.assertEqual(
+                [source_dir / "1_bilingual.txt", source_dir / "3_awq_bilingual.txt"],
+                [task.existing_bilingual_path for task in tasks],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
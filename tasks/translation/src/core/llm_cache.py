@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+LLM 输出的持久化缓存（sqlite）
+
+QC 等判定类调用的输入完全相同（模型 + 提示 + 生成参数）时，重跑无需再走一次流式请求。
+键为 sha256(命名空间 | 模型 | 请求负载)，值为模型原始输出文本。
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL
+)
+"""
+
+
+class LLMResponseCache:
+    """按 (命名空间, 模型, 请求负载) 缓存模型输出；每次操作单独连接，可跨线程/进程共享同一文件。"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def make_key(namespace: str, model: str, payload: Any) -> str:
+        """payload 需可 JSON 序列化（消息列表、生成参数等）。"""
+        body = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(f"{namespace}|{model}|{body}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time())),
+            )
+            conn.commit()
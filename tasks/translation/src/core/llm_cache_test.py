@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+import tempfile
+import unittest
+from pathlib import Path
+
+from tasks.translation.src.core.llm_cache import LLMResponseCache
+
+
+class LLMResponseCacheTest(unittest.TestCase):
+    def test_roundtrip_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "nested" / "cache.sqlite"
+            key = LLMResponseCache.make_key("qc|v1", "model-a", {"messages": [{"role": "user", "content": "x"}]})
+            LLMResponseCache(db_path).put(key, "GOOD")
+            self.assertEqual(LLMResponseCache(db_path).get(key), "GOOD")
+
+    def test_missing_key_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LLMResponseCache(Path(tmp) / "cache.sqlite")
+            self.assertIsNone(cache.get("absent"))
+
+    def test_key_depends_on_namespace_model_and_payload(self):
+        payload = {"messages": [{"role": "user", "content": "原文"}], "params": {"temperature": 0.0}}
+        key = LLMResponseCache.make_key("qc|v1", "model-a", payload)
+        self.assertEqual(key, LLMResponseCache.make_key("qc|v1", "model-a", dict(reversed(list(payload.items())))))
+        self.assertNotEqual(key, LLMResponseCache.make_key("qc|v2", "model-a", payload))
+        self.assertNotEqual(key, LLMResponseCache.make_key("qc|v1", "model-b", payload))
+        self.assertNotEqual(
+            key,
+            LLMResponseCache.make_key("qc|v1", "model-a", {**payload, "params": {"temperature": 0.7}}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
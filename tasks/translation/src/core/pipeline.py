@@ -3,7 +3,9 @@
 翻译流程控制模块
 """
 
+import hashlib
 import os
+import shutil
 import time
 from pathlib import Path
 from typing import Any, List, Tuple, Dict, Optional
@@ -17,7 +19,7 @@ from .run_state import TranslationStateStore
 from .translator import Translator
 from .file_handler import FileHandler
 from .task import TranslationTask
-from ..utils.file import parse_yaml_front_matter
+from ..utils.file import parse_yaml_front_matter, read_text_cached
 
 
 class TranslationPipeline:
@@ -31,8 +33,6 @@ class TranslationPipeline:
             config: 翻译配置
         """
         self.config = config
-        # 始终使用流式（用户要求仅保留流式路径）
-        self.config.stream = True
 
         # 配置 token 估算策略，必要时强制简易模式
         if getattr(self.config, "token_estimator", "auto") == "simple":
@@ -289,6 +289,7 @@ class TranslationPipeline:
         stage: str,
         reason: str = "",
         progress: Optional[Dict[str, Any]] = None,
+        content_key: str = "",
     ) -> None:
         if not self.state_store:
             return
@@ -301,8 +302,36 @@ class TranslationPipeline:
             stage=stage,
             reason=reason,
             progress=progress,
+            content_key=content_key,
         )
 
+    def _content_cache_key(self, content: str) -> str:
+        """源文内容 + 影响译文的配置/提示资产 的摘要，用于跨文件名复用已完成的输出。"""
+        digest = hashlib.blake2b(digest_size=16)
+        parts = [
+            self.config.model,
+            self.config.get_output_suffix(),
+            self.config.bilingual_simple,
+            getattr(self.config, "metadata_only", False),
+            self.config.prompt_style,
+        ]
+        for asset in (
+            self.config.preface_file,
+            self.config.preface_yaml_file,
+            self.config.preface_body_file,
+            self.config.terminology_file,
+            self.config.sample_file,
+            self.config.sample_yaml_file,
+            self.config.sample_body_file,
+            self.config.name_glossary_file,
+        ):
+            parts.append(read_text_cached(asset) if asset else None)
+        for part in parts:
+            digest.update(repr(part).encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
     def process_file(self, path: Path, task: Optional[TranslationTask] = None) -> bool:
         """
         处理单个文件
@@ -370,6 +399,26 @@ class TranslationPipeline:
         
         # 显示文章信息
         self._log_article_info(yaml_data, len(text_content))
+
+        # 同内容同配置已在别处译完（源文件改名/挪目录后重跑）：直接复用，不再调用模型
+        content_key = self._content_cache_key(content)
+        if self.state_store and not self.config.overwrite and not self.config.debug and not output_path.exists():
+            reused = self.state_store.find_completed_output(content_key, exclude=output_path)
+            if reused is not None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(reused, output_path)
+                self.logger.info(f"内容与已完成输出一致，复用: {reused} -> {output_path}")
+                qa_ok = self._run_qa_report(output_path, path, mode="translate")
+                self._record_processing_state(
+                    source_path=path,
+                    output_path=output_path,
+                    status="complete" if qa_ok else "failed",
+                    stage="reuse" if qa_ok else "qa",
+                    reason=f"复用 {reused}" if qa_ok else "QA gate failed",
+                    content_key=content_key,
+                )
+                return qa_ok
+
         self._prepare_name_glossary(path, content, yaml_data)
         
         # 检查是否需要处理
@@ -640,6 +689,7 @@ class TranslationPipeline:
                 "bilingual_simple": self.config.bilingual_simple,
                 "metadata_only": getattr(self.config, "metadata_only", False),
             },
+            content_key=content_key,
         )
         return saved and final_status == "complete" and qa_ok
 
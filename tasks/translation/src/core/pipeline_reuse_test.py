@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+_FILE = Path(__file__).resolve()
+_REPO_ROOT = _FILE.parents[4]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from tasks.translation.src.core.config import TranslationConfig
+from tasks.translation.src.core.pipeline import TranslationPipeline
+
+
+_CONTENT = "---\ntitle: テスト\n---\n彼は走った。\n"
+
+
+class _ReachedTranslation(Exception):
+    """复用未命中时 process_file 会继续走到人名预读/翻译阶段。"""
+
+
+class TestTranslationPipelineContentReuse(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base = Path(tmp.name)
+
+    def _pipeline_with_prior_output(self, base=None, **config_kwargs):
+        base = base or self.base
+        pipeline = TranslationPipeline(
+            TranslationConfig(log_dir=base / "logs", llm_provider="vllm", realtime_log=False, **config_kwargs)
+        )
+        old_source = base / "old" / "1.txt"
+        new_source = base / "new" / "1.txt"
+        for source in (old_source, new_source):
+            source.parent.mkdir(parents=True, exist_ok=True)
+            source.write_text(_CONTENT, encoding="utf-8")
+        prior_output = base / "old_done" / "1_zh.txt"
+        prior_output.parent.mkdir(parents=True)
+        prior_output.write_text("---\ntitle: 测试\n---\n他跑了。\n", encoding="utf-8")
+        pipeline.state_store.record_file_state(
+            run_id="earlier",
+            source_path=old_source,
+            output_path=prior_output,
+            mode="translate",
+            status="complete",
+            stage="save",
+            content_key=pipeline._content_cache_key(_CONTENT),
+        )
+        pipeline._prepare_name_glossary = mock.Mock(side_effect=_ReachedTranslation)
+        return pipeline, new_source, prior_output
+
+    def _record(self, pipeline, source: Path):
+        output_path = pipeline._get_output_path(source)
+        return output_path, pipeline.state_store._get_file_record(source, output_path, "translate")
+
+    def test_renamed_source_reuses_completed_output(self) -> None:
+        pipeline, new_source, prior_output = self._pipeline_with_prior_output()
+
+        self.assertTrue(pipeline.process_file(new_source))
+
+        output_path, record = self._record(pipeline, new_source)
+        self.assertEqual(output_path.read_text(encoding="utf-8"), prior_output.read_text(encoding="utf-8"))
+        self.assertEqual((record["status"], record["stage"]), ("complete", "reuse"))
+        self.assertEqual(record["content_key"], pipeline._content_cache_key(_CONTENT))
+        pipeline._prepare_name_glossary.assert_not_called()
+
+    def test_overwrite_and_debug_bypass_reuse(self) -> None:
+        for flags in ({"overwrite": True}, {"debug": True}):
+            with self.subTest(**flags), tempfile.TemporaryDirectory() as tmp:
+                pipeline, new_source, _ = self._pipeline_with_prior_output(Path(tmp), **flags)
+                with self.assertRaises(_ReachedTranslation):
+                    pipeline.process_file(new_source)
+
+    def test_missing_prior_output_is_not_reused(self) -> None:
+        pipeline, new_source, prior_output = self._pipeline_with_prior_output()
+        prior_output.unlink()
+
+        with self.assertRaises(_ReachedTranslation):
+            pipeline.process_file(new_source)
+        self.assertFalse(pipeline._get_output_path(new_source).exists())
+
+    def test_qa_failure_on_reused_copy_marks_record_failed(self) -> None:
+        pipeline, new_source, _ = self._pipeline_with_prior_output()
+        pipeline._run_qa_report = mock.Mock(return_value=False)
+
+        self.assertFalse(pipeline.process_file(new_source))
+
+        _, record = self._record(pipeline, new_source)
+        self.assertEqual((record["status"], record["stage"]), ("failed", "qa"))
+
+    def test_few_shot_assets_change_the_content_key(self) -> None:
+        sample_yaml = self.base / "sample_yaml.txt"
+        sample_body = self.base / "sample_body.txt"
+        sample_yaml.write_text("user:\nA\nassistant:\nB\n", encoding="utf-8")
+        sample_body.write_text("user:\nC\nassistant:\nD\n", encoding="utf-8")
+        pipeline = TranslationPipeline(
+            TranslationConfig(
+                log_dir=self.base / "logs",
+                llm_provider="vllm",
+                sample_yaml_file=sample_yaml,
+                sample_body_file=sample_body,
+            )
+        )
+        key = pipeline._content_cache_key(_CONTENT)
+
+        sample_yaml.write_text("user:\nA2\nassistant:\nB2\n", encoding="utf-8")
+        yaml_key = pipeline._content_cache_key(_CONTENT)
+        sample_body.write_text("user:\nC2\nassistant:\nD2\n", encoding="utf-8")
+        body_key = pipeline._content_cache_key(_CONTENT)
+
+        self.assertEqual(len({key, yaml_key, body_key}), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
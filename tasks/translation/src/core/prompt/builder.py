@@ -7,6 +7,7 @@ import re
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 from .config import PromptConfig, create_config
+from ...utils.file import read_text_cached
 
 
 class PromptBuilder:
@@ -20,6 +21,8 @@ class PromptBuilder:
             config: 配置对象，包含所有必要的配置信息
         """
         self.config = config
+        # 单槽缓存：(键, 系统+few-shot 前缀消息, few-shot 原文行数)
+        self._prefix_cache: Optional[Tuple[tuple, Tuple[Dict[str, str], ...], int]] = None
     
     def build_messages(
         self,
@@ -43,15 +46,10 @@ class PromptBuilder:
             消息列表
         """
         config = self.config
-        messages = []
-        
-        # 1. 构建系统消息
-        system_content = self._build_system_content(config)
-        messages.append({"role": "system", "content": system_content})
         
-        # 2. 添加few-shot示例
-        few_shot_messages = self._build_few_shot_messages(config)
-        messages.extend(few_shot_messages)
+        # 1-2. 系统消息 + few-shot示例（同一文件内各批次不变，复用缓存前缀）
+        prefix_messages, few_shot_line_count = self._get_prefix(config)
+        messages = [dict(m) for m in prefix_messages]
         
         # 3. 添加上下文（如果支持）
         if config.support_context and context_lines:
@@ -61,8 +59,6 @@ class PromptBuilder:
         # 4. 添加前一次的输入输出（如果支持）
         if config.support_previous_io and previous_io:
             # 计算previous_io的起始行号（基于few-shot示例的行数）
-            # few-shot示例的行数需要从sample文件中计算
-            few_shot_line_count = self._get_few_shot_line_count(config)
             prev_start_line_number = few_shot_line_count + 1
             prev_messages = self._build_previous_io_messages(previous_io, config, prev_start_line_number)
             messages.extend(prev_messages)
@@ -72,7 +68,6 @@ class PromptBuilder:
             current_start_line_number = few_shot_line_count + len(input_lines) + 1
         else:
             # 如果没有previous_io，当前消息从few-shot示例结束后开始
-            few_shot_line_count = self._get_few_shot_line_count(config)
             current_start_line_number = few_shot_line_count + 1
         
         # 5. 添加当前目标行
@@ -97,7 +92,7 @@ class PromptBuilder:
         返回值：(messages, current_start_line_number)
         """
         # 预计算当前起始行号（few-shot + previous_io）
-        few_shot_line_count = self._get_few_shot_line_count(self.config)
+        _, few_shot_line_count = self._get_prefix(self.config)
         if self.config.support_previous_io and previous_io:
             input_lines, _ = previous_io
             current_start_line_number = few_shot_line_count + len(input_lines) + 1
@@ -117,15 +112,44 @@ class PromptBuilder:
 
         return messages, current_start_line_number
     
+    def _get_prefix(self, config: PromptConfig) -> Tuple[Tuple[Dict[str, str], ...], int]:
+        """返回系统消息+few-shot前缀及few-shot原文行数。
+
+        前缀只取决于配置和资产文件内容，按两者缓存；任一变化（如按文件注入的
+        人名表、被编辑的 preface）都会重新构建。前缀逐字节不变也便于 vLLM
+        前缀缓存命中。
+        """
+        terminology = (
+            read_text_cached(config.data_dir / config.terminology_file)
+            if config.terminology_file else None
+        )
+        key = (
+            config.mode,
+            config.use_end_marker,
+            config.end_marker,
+            config.extra_system_context,
+            read_text_cached(config.data_dir / config.preface_file),
+            terminology,
+            read_text_cached(config.data_dir / config.sample_file),
+        )
+        cached = self._prefix_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        prefix = (
+            {"role": "system", "content": self._build_system_content(config)},
+            *self._build_few_shot_messages(config),
+        )
+        line_count = self._get_few_shot_line_count(config)
+        self._prefix_cache = (key, prefix, line_count)
+        return prefix, line_count
+
     def _get_few_shot_line_count(self, config: PromptConfig) -> int:
         """计算few-shot示例中原文的行数"""
         # 读取sample文件
-        sample_path = config.data_dir / config.sample_file
-        if not sample_path.exists():
+        sample_content = read_text_cached(config.data_dir / config.sample_file)
+        if sample_content is None:
             return 0
-
-        with open(sample_path, 'r', encoding='utf-8') as f:
-            sample_content = f.read().strip()
+        sample_content = sample_content.strip()
 
         # 解析sample内容，只计算原文的行数
         lines = sample_content.split('\n')
@@ -153,21 +177,18 @@ class PromptBuilder:
     def _build_system_content(self, config: PromptConfig) -> str:
         """构建系统消息内容"""
         # 读取preface文件
-        preface_path = config.data_dir / config.preface_file
-        if preface_path.exists():
-            with open(preface_path, 'r', encoding='utf-8') as f:
-                system_content = f.read().strip()
+        preface = read_text_cached(config.data_dir / config.preface_file)
+        if preface is not None:
+            system_content = preface.strip()
         else:
             # 默认内容
             system_content = self._get_default_system_content(config.mode)
         
         # 添加术语表（如果有）
         if config.terminology_file:
-            terminology_path = config.data_dir / config.terminology_file
-            if terminology_path.exists():
-                with open(terminology_path, 'r', encoding='utf-8') as f:
-                    terminology = f.read().strip()
-                    system_content += f"\n\n术语对照表：\n{terminology}"
+            terminology = read_text_cached(config.data_dir / config.terminology_file)
+            if terminology is not None:
+                system_content += f"\n\n术语对照表：\n{terminology.strip()}"
 
         if config.extra_system_context:
             system_content += f"\n\n{config.extra_system_context.strip()}"
@@ -178,14 +199,13 @@ class PromptBuilder:
         """构建few-shot示例消息"""
         messages = []
         
-        sample_path = config.data_dir / config.sample_file
-        if not sample_path.exists():
-            return messages
         try:
-            with open(sample_path, 'r', encoding='utf-8') as f:
-                sample_content = f.read().strip()
+            sample_content = read_text_cached(config.data_dir / config.sample_file)
         except Exception:
             return messages
+        if sample_content is None:
+            return messages
+        sample_content = sample_content.strip()
         if not sample_content:
             return messages
         messages = self._parse_sample_content(sample_content, config)
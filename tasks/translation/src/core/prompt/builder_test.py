@@ -780,6 +780,21 @@ class TestPromptBuilder:
         content = current_msg["content"].split("\n")
         assert any(line.startswith(f"{start_ln}. 原文: ") for line in content)
 
+    def test_prefix_reused_across_batches_and_rebuilt_on_config_change(self, builder):
+        """同配置下各批次复用前缀；extra_system_context 变化后系统消息随之更新"""
+        first = builder.build_messages(target_lines=["一行目"])
+        second = builder.build_messages(target_lines=["二行目"])
+        prefix_len = len(first) - 1
+        assert first[:prefix_len] == second[:prefix_len]
+
+        first[0]["content"] = "已被调用方修改"
+        assert builder.build_messages(target_lines=["三行目"])[0] == second[0]
+
+        builder.config.extra_system_context = "人名表：田中 -> 田中"
+        third = builder.build_messages(target_lines=["三行目"])
+        assert third[0]["content"].endswith("人名表：田中 -> 田中")
+        assert third[1:prefix_len] == second[1:prefix_len]
+
 
 if __name__ == "__main__":
     # 简单的手动测试
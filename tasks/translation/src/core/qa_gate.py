@@ -19,6 +19,9 @@ except ImportError:  # unittest discover may import this module as top-level cor
 
 KANA_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30ff]")
 IGNORED_KANA_CHARS = {"・", "ー"}
+# KANA_RE 去掉 IGNORED_KANA_CHARS（U+30FB、U+30FC），一次 search 即可判定
+_MEANINGFUL_KANA_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30fa\u30fd-\u30ff]")
+_HAN_RE = re.compile(r"[一-鿿]")  # CJK 汉字
 _QA_GATE_MESSAGES = {
     "empty_translation": "译文行为空",
     "failure_marker": "译文行包含失败标记",
@@ -93,7 +96,7 @@ def _split_front_matter(lines: List[str]) -> Tuple[List[str], List[str]]:
 
 
 def _contains_kana(text: str) -> bool:
-    return any(ch not in IGNORED_KANA_CHARS for ch in KANA_RE.findall(text or ""))
+    return _MEANINGFUL_KANA_RE.search(text or "") is not None
 
 
 def _is_translatable_source(text: str) -> bool:
@@ -101,7 +104,7 @@ def _is_translatable_source(text: str) -> bool:
     没有可翻译内容,正确译文本就等于原文,不应判 same_as_source。两条硬规则路径共用此判定。"""
     if _contains_kana(text):
         return True
-    return any("一" <= ch <= "鿿" for ch in text)  # CJK 汉字
+    return _HAN_RE.search(text) is not None
 
 
 def hard_rule_hits(source: str, translation: str) -> List[Dict[str, str]]:
@@ -5,16 +5,65 @@
 
 import re
 import json
+import sqlite3
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
 from openai import OpenAI
 from openai import BadRequestError
 
 from .config import TranslationConfig
+from .llm_cache import LLMResponseCache
 from .streaming_handler import StreamingHandler
 from .profile_manager import ProfileManager, GenerationParams
 from .logger import UnifiedLogger
+from ..utils.file import read_text_cached
+
+# Hiragana: \u3040-\u309F, Katakana: \u30A0-\u30FF, 半角片假名: \uFF66-\uFF9D
+KANA_RE = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\uFF66-\uFF9D]")
+_THINK_BLOCK_RE = re.compile(r"<think>[\s\S]*?</think>", re.IGNORECASE)
+_VERDICT_RE = re.compile(r"\b(GOOD|BAD)\b")
+
+
+@lru_cache(maxsize=8)
+def _parse_role_blocks(raw: str) -> Tuple[Tuple[str, str], ...]:
+    """把 few-shot 样例按 User:/Assistant: 切成 (role, content) 块。
+
+    样例文件内容不变时（read_text_cached 返回同一字符串）直接命中缓存，
+    各批次的 QC 调用不再逐行重复解析。
+    """
+    blocks: list[Tuple[str, str]] = []
+    current_role: str | None = None
+    buffer: list[str] = []
+
+    def flush() -> None:
+        nonlocal buffer
+        if current_role and buffer:
+            content = '\n'.join(buffer).strip()
+            if content:
+                blocks.append((current_role, content))
+        buffer = []
+
+    for ln in raw.splitlines():
+        low = ln.strip().lower()
+        if low.startswith('user:'):
+            flush()
+            current_role = 'user'
+            remainder = ln[5:].lstrip()
+            if remainder:
+                buffer.append(remainder)
+            continue
+        if low.startswith('assistant:'):
+            flush()
+            current_role = 'assistant'
+            remainder = ln[10:].lstrip()
+            if remainder:
+                buffer.append(remainder)
+            continue
+        buffer.append(ln)
+    flush()
+    return tuple(blocks)
 
 
 class QualityChecker:
@@ -65,6 +114,26 @@ class QualityChecker:
             self.client = OpenAI(base_url=base_url, api_key=api_key, timeout=client_timeout)
         self.profile_manager = ProfileManager(config.profiles_file)
         self.streaming_handler = StreamingHandler(self.client, logger, config, self.profile_manager)
+        self._qc_cache: Optional[LLMResponseCache] = None
+        self._qc_cache_failed = False
+
+    def _warn_qc_cache(self, action: str, exc: Exception) -> None:
+        if self.logger:
+            self.logger.warning(f"质检缓存{action}失败，按未命中处理: {exc}")
+
+    def _get_qc_cache(self) -> Optional[LLMResponseCache]:
+        """首次 LLM 质检时才创建缓存文件；--no-qc-cache 或缓存文件无法打开时返回 None。"""
+        if not getattr(self.config, "qc_cache", False) or self._qc_cache_failed:
+            return None
+        if self._qc_cache is None:
+            try:
+                self._qc_cache = LLMResponseCache(Path(self.config.log_dir) / "qc_cache.sqlite")
+            except (sqlite3.Error, OSError) as exc:
+                # 打不开就本进程内不再重试，质检照常走模型
+                self._qc_cache_failed = True
+                self._warn_qc_cache("初始化", exc)
+                return None
+        return self._qc_cache
     
     def check_translation_quality_basic(
         self,
@@ -116,7 +185,7 @@ class QualityChecker:
         
         # 检查日语字符比例（仅以假名判定，避免将中文汉字误判为日文汉字）
         # Hiragana: \u3040-\u309F, Katakana: \u30A0-\u30FF, 半角片假名: \uFF66-\uFF9D
-        japanese_chars = len(re.findall(r'[\u3040-\u309F\u30A0-\u30FF\uFF66-\uFF9D]', translated_text))
+        japanese_chars = len(KANA_RE.findall(translated_text))
         total_chars = len(translated_text)
         
         if bilingual:
@@ -171,11 +240,24 @@ class QualityChecker:
         Returns:
             (verdicts, summary, conclusion) - 与LLM QC保持一致的格式
         """
-        try:
-            # 分割为行
-            original_lines = [ln.strip() for ln in original_text.split('\n') if ln.strip()]
-            translated_lines = [ln.strip() for ln in translated_text.split('\n') if ln.strip()]
+        # 分割为行
+        original_lines = [ln.strip() for ln in original_text.split('\n') if ln.strip()]
+        translated_lines = [ln.strip() for ln in translated_text.split('\n') if ln.strip()]
+        return self.check_translation_quality_rules_from_lines(original_lines, translated_lines, bilingual)
+
+    def check_translation_quality_rules_from_lines(self, original_lines: list[str], translated_lines: list[str], bilingual: bool = False) -> Tuple[list[str], str, str]:
+        """
+        逐行规则QC的列表版本：调用方已有去空白的非空行时直接传入，省去 join 再 split
+        
+        Args:
+            original_lines: 原文非空行（已 strip）
+            translated_lines: 译文非空行（已 strip）
+            bilingual: 是否为双语模式
             
+        Returns:
+            (verdicts, summary, conclusion) - 与LLM QC保持一致的格式
+        """
+        try:
             if not original_lines or not translated_lines:
                 return [], "规则QC检测失败：原文或译文为空", "需要重译"
             
@@ -205,8 +287,8 @@ class QualityChecker:
                     verdicts.append('GOOD')
             
             # 统计结果
-            good_count = sum(v == 'GOOD' for v in verdicts)
-            bad_count = sum(v == 'BAD' for v in verdicts)
+            bad_count = len(bad_lines)
+            good_count = len(verdicts) - bad_count
             
             # 记录QC指标
             if self.logger:
@@ -300,13 +382,9 @@ class QualityChecker:
                 return True, "无内容行"
             
             # 使用规则QC进行逐行检测
-            verdicts, summary, conclusion = self.check_translation_quality_rules_lines(original_text, translated_text, bilingual)
+            verdicts, summary, conclusion = self.check_translation_quality_rules_from_lines(orig_lines, tran_lines, bilingual)
             
-            # 统计BAD行数
-            bad_count = sum(1 for v in verdicts if v == 'BAD')
-            good_count = len(verdicts) - bad_count
-            
-            if bad_count == 0:
+            if 'BAD' not in verdicts:
                 return True, f"规则QC通过: {summary}"
             else:
                 return False, f"规则QC发现问题: {summary}"
@@ -352,6 +430,21 @@ class QualityChecker:
                 max_tokens=max_tokens if max_tokens > 0 else 0,
                 stop=[],
             )
+            cache = self._get_qc_cache()
+            cache_key = ""
+            if cache is not None:
+                cache_key = cache.make_key(
+                    "qc|v1", self.config.model, {"messages": messages, "params": params.to_dict()}
+                )
+                try:
+                    cached = cache.get(cache_key)
+                except (sqlite3.Error, OSError) as exc:
+                    cached = None
+                    self._warn_qc_cache("读取", exc)
+                if cached is not None:
+                    self.logger.info("质量检测命中缓存，跳过模型调用")
+                    return cached
+
             result, token_stats = self.streaming_handler.stream_with_params(
                 model=self.config.model,
                 messages=messages,
@@ -361,7 +454,14 @@ class QualityChecker:
             # 记录token使用情况
             self.logger.info(f"质量检测完成，Token使用情况: {token_stats}")
             
-            return result.strip()
+            result = result.strip()
+            # 只缓存含 GOOD/BAD 裁决的输出，截断/空输出下次仍重新请求
+            if cache is not None and _VERDICT_RE.search(_THINK_BLOCK_RE.sub("", result).upper()):
+                try:
+                    cache.put(cache_key, result)
+                except (sqlite3.Error, OSError) as exc:
+                    self._warn_qc_cache("写入", exc)
+            return result
             
         except Exception as e:
             if self.logger:
@@ -376,8 +476,9 @@ class QualityChecker:
 
         system_content = "你是翻译质检员。仅输出一个词（GOOD 或 BAD）。不要解释。"
         try:
-            if preface_path.exists():
-                system_content = preface_path.read_text(encoding='utf-8').strip()
+            preface_text = read_text_cached(preface_path)
+            if preface_text is not None:
+                system_content = preface_text.strip()
         except Exception:
             pass
 
@@ -385,28 +486,9 @@ class QualityChecker:
 
         # 复用逐行few-shot
         try:
-            if sample_path.exists():
-                raw = sample_path.read_text(encoding='utf-8')
-                lines = [ln.rstrip('\n') for ln in raw.splitlines()]
-                current_role: str | None = None
-                buffer: list[str] = []
-                def flush():
-                    nonlocal buffer, current_role
-                    if current_role and buffer:
-                        content = '\n'.join(buffer).strip()
-                        if content:
-                            messages.append({"role": current_role, "content": content})
-                    buffer = []
-                for ln in lines:
-                    low = ln.strip().lower()
-                    if low.startswith('user:'):
-                        flush(); current_role = 'user'; rem = ln[5:].lstrip();
-                        if rem: buffer.append(rem); continue
-                    if low.startswith('assistant:'):
-                        flush(); current_role = 'assistant'; rem = ln[10:].lstrip();
-                        if rem: buffer.append(rem); continue
-                    buffer.append(ln)
-                flush()
+            raw = read_text_cached(sample_path)
+            if raw is not None:
+                messages.extend({"role": role, "content": content} for role, content in _parse_role_blocks(raw))
         except Exception:
             pass
 
@@ -433,8 +515,9 @@ class QualityChecker:
         required = "你是翻译质检员。逐行判定每行是否为高质量翻译。仅输出每行一个词（GOOD 或 BAD），与用户输入行数一致，不要解释。倒数第二行输出[结论:需要重译]或[结论:不需要重译]。最后单独输出一行：[检查完成]。"
         system_content = required
         try:
-            if preface_path.exists():
-                preface_text = preface_path.read_text(encoding='utf-8').strip()
+            preface_text = read_text_cached(preface_path)
+            if preface_text is not None:
+                preface_text = preface_text.strip()
                 # 如果preface文件存在且内容不同，则使用preface内容
                 if preface_text != required:
                     system_content = preface_text
@@ -445,30 +528,9 @@ class QualityChecker:
 
         # few-shot：直接原样拼接（按User/Assistant块），不强行改写，资产需符合逐行风格
         try:
-            if sample_path.exists():
-                raw = sample_path.read_text(encoding='utf-8')
-                lines = [ln.rstrip('\n') for ln in raw.splitlines()]
-                current_role: str | None = None
-                buf: list[str] = []
-
-                def flush() -> None:
-                    nonlocal buf, current_role
-                    if current_role and buf:
-                        content = '\n'.join(buf).strip()
-                        if content:
-                            messages.append({"role": current_role, "content": content})
-                    buf = []
-
-                for ln in lines:
-                    low = ln.strip().lower()
-                    if low.startswith('user:'):
-                        flush(); current_role = 'user'; rem = ln[5:].lstrip();
-                        if rem: buf.append(rem); continue
-                    if low.startswith('assistant:'):
-                        flush(); current_role = 'assistant'; rem = ln[10:].lstrip();
-                        if rem: buf.append(rem); continue
-                    buf.append(ln)
-                flush()
+            raw = read_text_cached(sample_path)
+            if raw is not None:
+                messages.extend({"role": role, "content": content} for role, content in _parse_role_blocks(raw))
         except Exception:
             pass
 
@@ -629,8 +691,9 @@ class QualityChecker:
 
         system_content = "你是翻译质检员。仅输出一个词（GOOD 或 BAD）。不要解释。"
         try:
-            if preface_path.exists():
-                system_content = preface_path.read_text(encoding='utf-8').strip()
+            preface_text = read_text_cached(preface_path)
+            if preface_text is not None:
+                system_content = preface_text.strip()
         except Exception:
             pass
 
@@ -638,39 +701,9 @@ class QualityChecker:
 
         # 追加few-shot（多轮对话，保证格式与下方user一致）
         try:
-            if sample_path.exists():
-                raw = sample_path.read_text(encoding='utf-8')
-                lines = [ln.rstrip('\n') for ln in raw.splitlines()]
-                current_role: str | None = None
-                buffer: list[str] = []
-                parsed: list[dict] = []
-
-                def flush() -> None:
-                    nonlocal buffer, current_role
-                    if current_role and buffer:
-                        content = '\n'.join(buffer).strip()
-                        if content:
-                            parsed.append({"role": current_role, "content": content})
-                    buffer = []
-
-                for ln in lines:
-                    low = ln.strip().lower()
-                    if low.startswith('user:'):
-                        flush()
-                        current_role = 'user'
-                        remainder = ln[5:].lstrip()
-                        if remainder:
-                            buffer.append(remainder)
-                        continue
-                    if low.startswith('assistant:'):
-                        flush()
-                        current_role = 'assistant'
-                        remainder = ln[10:].lstrip()
-                        if remainder:
-                            buffer.append(remainder)
-                        continue
-                    buffer.append(ln)
-                flush()
+            raw = read_text_cached(sample_path)
+            if raw is not None:
+                parsed = [{"role": role, "content": content} for role, content in _parse_role_blocks(raw)]
 
                 # 规范化 few-shot：严格 user(含“原文/译文”) -> assistant(仅 GOOD/BAD)
                 normalized: list[dict] = []
@@ -714,14 +747,12 @@ class QualityChecker:
 
     def _clean_quality_output(self, text: str) -> str:
         """移除大模型的思维/标记等噪声，得到判定可读文本。"""
-        import re
-        cleaned = re.sub(r"<think>[\s\S]*?</think>", "", text, flags=re.IGNORECASE)
+        cleaned = _THINK_BLOCK_RE.sub("", text)
         return cleaned.strip()
 
     def _extract_verdict(self, text: str) -> str:
         """从输出中提取最终结论（取最后一个 GOOD/BAD）。"""
-        import re
-        matches = re.findall(r"\b(GOOD|BAD)\b", text.upper())
+        matches = _VERDICT_RE.findall(text.upper())
         return matches[-1] if matches else ""
     
     def check_translation_quality(self, original_text: str, translated_text: str, bilingual: bool = False) -> Tuple[bool, str]:
@@ -866,12 +897,8 @@ class QualityChecker:
     
     def _has_chinese_copying_japanese(self, original_text: str, translated_text: str, bilingual: bool) -> bool:
         """检查中文是否直接复制了日语（内部实现）"""
-        import re
-        
-        # 检查是否完全相同且都包含假名
-        if original_text == translated_text:
-            kana_pattern = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\uFF66-\uFF9D]")
-            if kana_pattern.search(original_text) and kana_pattern.search(translated_text):
-                return True
+        # 检查是否完全相同且都包含假名（两段相同，查一次即可）
+        if original_text == translated_text and KANA_RE.search(original_text):
+            return True
         
         return False
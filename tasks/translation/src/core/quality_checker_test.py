@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
+import sqlite3
+import tempfile
 import unittest
 import sys
 from pathlib import Path
+from unittest import mock
 
 # 确保可以从仓库根导入 tasks.translation 包
 _FILE = Path(__file__).resolve()
@@ -12,20 +15,23 @@ if str(_REPO_ROOT) not in sys.path:
 from tasks.translation.src.core.config import TranslationConfig
 from tasks.translation.src.core.quality_checker import QualityChecker
 from tasks.translation.src.core.logger import UnifiedLogger
+from tasks.translation.src.core.llm_cache import LLMResponseCache
 
 
 class DummyStreamingHandler:
     def __init__(self, fixed_text: str):
         self.fixed_text = fixed_text
+        self.calls = 0
 
     def stream_with_params(self, model, messages, params):
+        self.calls += 1
         # 返回固定结果与一个简易token统计
         return self.fixed_text, {"input_tokens": 0, "output_tokens": len(self.fixed_text) // 2}
 
 
 class TestQualityCheckerLLM(unittest.TestCase):
     def setUp(self):
-        self.config = TranslationConfig()
+        self.config = TranslationConfig(qc_cache=False)
         # 保障有日志器且不会因为缺少属性报错
         self.logger = UnifiedLogger.create_console_only()
 
@@ -77,6 +83,51 @@ class TestQualityCheckerLLM(unittest.TestCase):
         self.assertTrue(captured["basic_bilingual"])
         self.assertTrue(captured["llm_bilingual"])
 
+    def test_llm_check_reuses_cached_verdict(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = TranslationConfig(log_dir=Path(tmp))
+            first = QualityChecker(config, logger=self.logger)
+            first.streaming_handler = DummyStreamingHandler("GOOD")
+            first.check_translation_quality_with_llm("彼は走った。", "他跑了起来。")
+            self.assertEqual(first.streaming_handler.calls, 1)
+
+            second = QualityChecker(config, logger=self.logger)
+            second.streaming_handler = DummyStreamingHandler("BAD")
+            ok, reason = second.check_translation_quality_with_llm("彼は走った。", "他跑了起来。")
+            self.assertTrue(ok, msg=reason)
+            self.assertEqual(second.streaming_handler.calls, 0)
+
+    def test_llm_check_does_not_cache_output_without_verdict(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = TranslationConfig(log_dir=Path(tmp))
+            qc = QualityChecker(config, logger=self.logger)
+            qc.streaming_handler = DummyStreamingHandler("<think>…")
+            qc.check_translation_quality_with_llm("彼は走った。", "他跑了起来。")
+            qc.check_translation_quality_with_llm("彼は走った。", "他跑了起来。")
+            self.assertEqual(qc.streaming_handler.calls, 2)
+
+    def test_unusable_cache_location_falls_back_to_model(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp) / "logs"
+            log_dir.write_text("not a directory", encoding="utf-8")
+            qc = QualityChecker(TranslationConfig(log_dir=log_dir), logger=self.logger)
+            qc.streaming_handler = DummyStreamingHandler("GOOD")
+            ok, reason = qc.check_translation_quality_with_llm("彼は走った。", "他跑了起来。")
+            self.assertTrue(ok, msg=reason)
+            self.assertEqual(qc.streaming_handler.calls, 1)
+
+    def test_cache_read_and_write_errors_keep_model_verdict(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            qc = QualityChecker(TranslationConfig(log_dir=Path(tmp)), logger=self.logger)
+            qc.streaming_handler = DummyStreamingHandler("BAD")
+            locked = sqlite3.OperationalError("database is locked")
+            with mock.patch.object(LLMResponseCache, "get", side_effect=locked), \
+                    mock.patch.object(LLMResponseCache, "put", side_effect=locked):
+                ok, reason = qc._check_translation_quality_block("彼は走った。", "彼は走った。", False)
+            self.assertFalse(ok)
+            self.assertEqual(reason, "整块QC: BAD")
+            self.assertEqual(qc.streaming_handler.calls, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
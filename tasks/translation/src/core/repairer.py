@@ -60,15 +60,14 @@ def align_existing_translations(
     return translations, unmatched
 
 
+# 平假名/片假名，排除中点 U+30FB 与长音符 U+30FC
+_KANA_CHAR_RE = re.compile(r"[\u3040-\u30fa\u30fd-\u30ff]")
+
+
 def detect_kana_chars(text: str) -> List[str]:
     if not text:
         return []
-    chars = {
-        ch
-        for ch in text
-        if "\u3040" <= ch <= "\u30ff" and ch not in {"\u30fb", "\u30fc"}
-    }
-    return sorted(chars)
+    return sorted(set(_KANA_CHAR_RE.findall(text)))
 
 
 def analyze_translation(
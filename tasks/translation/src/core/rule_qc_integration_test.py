@@ -82,6 +82,16 @@ class TestRuleQCIntegration(unittest.TestCase):
         self.assertEqual(conclusion, "需要重译", f"有BAD行应该需要重译: {conclusion}")
         self.assertIn("BAD索引=[1]", summary, f"摘要应该包含BAD行信息: {summary}")
 
+    def test_rule_qc_from_lines_matches_text_api(self):
+        """列表版本与文本版本结果一致"""
+        original = "1234567890\n\n  正常文本  "
+        translated = "短\n正常译文\n"
+        from_text = self.qc.check_translation_quality_rules_lines(original, translated, bilingual=False)
+        from_lines = self.qc.check_translation_quality_rules_from_lines(
+            ["1234567890", "正常文本"], ["短", "正常译文"], bilingual=False
+        )
+        self.assertEqual(from_lines, from_text)
+
     def test_line_alignment_check(self):
         """测试行数对齐检查"""
         # 测试正常对齐
@@ -106,6 +106,7 @@ class TranslationStateStore:
         stage: str,
         reason: str = "",
         progress: Optional[Dict[str, Any]] = None,
+        content_key: str = "",
     ) -> Dict[str, Any]:
         key = self._file_key(source_path, output_path, mode)
         existing = dict(self._data.setdefault("files", {}).get(key, {}))
@@ -123,6 +124,8 @@ class TranslationStateStore:
         )
         if progress is not None:
             existing["progress"] = progress
+        if content_key:
+            existing["content_key"] = content_key
         if stage == "start":
             attempts = int(existing.get("attempts", 0) or 0)
             existing["attempts"] = attempts + 1
@@ -331,6 +334,7 @@ class TranslationStateStore:
         stage: str,
         reason: str = "",
         progress: Optional[Dict[str, Any]] = None,
+        content_key: str = "",
     ) -> Dict[str, Any]:
         return self._upsert_file_record(
             run_id=run_id,
@@ -341,4 +345,22 @@ class TranslationStateStore:
             stage=stage,
             reason=reason,
             progress=progress,
+            content_key=content_key,
         )
+
+    def find_completed_output(self, content_key: str, exclude: Optional[Path] = None) -> Optional[Path]:
+        """按内容键查找已完成且仍存在的翻译输出（源文件改名或换目录后复用）。"""
+        if not content_key:
+            return None
+        exclude_key = self._normalize_path(exclude)
+        for record in self._data.get("files", {}).values():
+            if (
+                record.get("content_key") != content_key
+                or record.get("mode") != "translate"
+                or record.get("status") != "complete"
+            ):
+                continue
+            output_key = record.get("output_path", "")
+            if output_key and output_key != exclude_key and Path(output_key).is_file():
+                return Path(output_key)
+        return None
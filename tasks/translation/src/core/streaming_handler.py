@@ -7,6 +7,7 @@ from typing import Tuple, Dict, Optional, List
 from dataclasses import dataclass
 import time
 import json
+import random
 import requests
 from openai import OpenAI
 from openai import BadRequestError
@@ -14,6 +15,9 @@ from .logger import UnifiedLogger
 from .config import TranslationConfig
 from .profile_manager import ProfileManager, GenerationParams
 
+# OpenRouter 走 requests + SSE；进程内共用一个 Session 以复用 TLS 连接
+_HTTP_SESSION = requests.Session()
+
 
 class StreamingHandler:
     """流式输出处理器"""
@@ -33,6 +37,10 @@ class StreamingHandler:
         self.config = config
         self.profile_manager = profile_manager or ProfileManager()
         self._buffer = ""
+        # 按 log_prefix 记录上一次写入日志的消息 (role, content)，用于省略各批次相同的 system/few-shot 前缀；
+        # logger 切换（换文件）后清空，保证每个日志文件首次调用都写出完整 prompt
+        self._last_logged_messages: Dict[str, List[Tuple[str, str]]] = {}
+        self._last_logged_logger: Optional[UnifiedLogger] = None
     
     def stream_completion(self,
                           model: str,
@@ -74,7 +82,7 @@ class StreamingHandler:
             # 统一：在调用前漂亮打印完整 messages 到文件日志
             try:
                 if self.logger:
-                    pretty = self._format_messages(messages)
+                    pretty = self._format_messages(messages, log_prefix)
                     self.logger.info(f"{log_prefix} Prompt (messages):\n{pretty}", mode=UnifiedLogger.LogMode.BOTH)
             except Exception:
                 pass
@@ -143,9 +151,11 @@ class StreamingHandler:
             for attempt in range(max_retries + 1):
                 try:
                     if attempt > 0:
+                        # 指数退避 + 抖动：服务端过载时逐次拉长间隔，避免固定节奏扎堆重试
+                        delay = retry_delay_s * (2 ** (attempt - 1)) + random.uniform(0, 0.5)
                         if self.logger:
-                            self.logger.warning(f"{log_prefix}: 第{attempt}次重试，延迟{retry_delay_s}秒...")
-                        time.sleep(retry_delay_s)
+                            self.logger.warning(f"{log_prefix}: 第{attempt}次重试，延迟{delay:.1f}秒...")
+                        time.sleep(delay)
                     
                     # OpenRouter 走 requests + SSE，避免 SDK 流式偶发连接问题
                     if self.config and getattr(self.config, 'llm_provider', '').lower() == 'openrouter':
@@ -170,7 +180,7 @@ class StreamingHandler:
                             "messages": messages,
                             "stream": True,
                         }
-                        with requests.post(url, headers=headers, data=json.dumps(payload), stream=True, timeout=(10, 60)) as r:
+                        with _HTTP_SESSION.post(url, headers=headers, data=json.dumps(payload), stream=True, timeout=(10, 60)) as r:
                             r.raise_for_status()
                             # 强制使用 UTF-8 以避免 SSE 默认 ISO-8859-1 导致乱码
                             try:
@@ -239,70 +249,75 @@ class StreamingHandler:
                                 self.logger.info(f"{log_prefix}: {current_line}", mode=UnifiedLogger.LogMode.FILE)
                         current_line = ""
                     
-                    for chunk in resp:
-                        # 检查是否有finish_reason
-                        if hasattr(chunk.choices[0], 'finish_reason') and chunk.choices[0].finish_reason:
-                            finish_reason = chunk.choices[0].finish_reason
+                    # 看门狗/哨兵提前 break 时主动关闭流，服务端随即中止生成，不再为丢弃的输出占用 GPU
+                    try:
+                        for chunk in resp:
+                            # 检查是否有finish_reason
+                            if hasattr(chunk.choices[0], 'finish_reason') and chunk.choices[0].finish_reason:
+                                finish_reason = chunk.choices[0].finish_reason
                         
-                        if chunk.choices[0].delta.content:
-                            content = chunk.choices[0].delta.content
-                            # 检测重复 token（以增量 piece 作为粒度）
-                            piece = content
-                            if piece == last_piece:
-                                repeat_count += 1
-                            else:
-                                last_piece = piece
-                                repeat_count = 0
-                            # 仅当重复的是极短片段（如单字符/空白），并且重复次数很高时才截断
-                            if enable_repeat_guard and len(piece.strip()) <= 1 and repeat_count > 40:
-                                if self.logger:
-                                    self.logger.warning(f"{log_prefix}: 检测到极短增量内容连续重复超过 20 次，提前截断流。")
-                                finish_reason = "repetition_guard"
-                                break
-                            result += content
-                            current_line += content
-                            
-                            # 仅将增量内容流式输出到控制台（不通过logger，避免[DEBUG]标签）
-                            print(content, end="", flush=True)
-                            
-                            # 检查是否完成了一行
-                            if '\n' in current_line:
-                                lines = current_line.split('\n')
-                                for line in lines[:-1]:
-                                    current_line = line
-                                    flush_current_line('newline')
-                                current_line = lines[-1]
-                            elif len(current_line) >= flush_threshold:
-                                flush_current_line('threshold')
-
-                            # 看门狗：时间超时
-                            if watchdog_timeout_s is not None and watchdog_timeout_s > 0:
-                                if time.time() - start_time > watchdog_timeout_s:
+                            if chunk.choices[0].delta.content:
+                                content = chunk.choices[0].delta.content
+                                # 检测重复 token（以增量 piece 作为粒度）
+                                piece = content
+                                if piece == last_piece:
+                                    repeat_count += 1
+                                else:
+                                    last_piece = piece
+                                    repeat_count = 0
+                                # 仅当重复的是极短片段（如单字符/空白），并且重复次数很高时才截断
+                                if enable_repeat_guard and len(piece.strip()) <= 1 and repeat_count > 40:
                                     if self.logger:
-                                        self.logger.warning(f"{log_prefix}: 超过流式超时 {watchdog_timeout_s}s，提前停止读取。")
-                                    finish_reason = "timeout"
+                                        self.logger.warning(f"{log_prefix}: 检测到极短增量内容连续重复超过 20 次，提前截断流。")
+                                    finish_reason = "repetition_guard"
                                     break
+                                result += content
+                                current_line += content
+                            
+                                # 仅将增量内容流式输出到控制台（不通过logger，避免[DEBUG]标签）
+                                print(content, end="", flush=True)
+                            
+                                # 检查是否完成了一行
+                                if '\n' in current_line:
+                                    lines = current_line.split('\n')
+                                    for line in lines[:-1]:
+                                        current_line = line
+                                        flush_current_line('newline')
+                                    current_line = lines[-1]
+                                elif len(current_line) >= flush_threshold:
+                                    flush_current_line('threshold')
 
-                            # 看门狗：长片段重复（检测尾部n-gram三连）
-                            if enable_repeat_guard:
-                                tail = result[-480:]
-                                if len(tail) >= 120:
-                                    n = 120
-                                    a = tail[-n:]
-                                    b = tail[-2*n:-n]
-                                    c = tail[-3*n:-2*n]
-                                    if a and a == b == c:
+                                # 看门狗：时间超时
+                                if watchdog_timeout_s is not None and watchdog_timeout_s > 0:
+                                    if time.time() - start_time > watchdog_timeout_s:
                                         if self.logger:
-                                            self.logger.warning(f"{log_prefix}: 检测到尾部片段重复三次，提前停止读取。")
-                                        finish_reason = "repetition_guard"
+                                            self.logger.warning(f"{log_prefix}: 超过流式超时 {watchdog_timeout_s}s，提前停止读取。")
+                                        finish_reason = "timeout"
                                         break
 
-                            # 哨兵：检测结论行
-                            if sentinel_prefix and sentinel_prefix in result:
-                                # 找到结论行后提前结束
-                                finish_reason = "sentinel"
-                                break
-                    
+                                # 看门狗：长片段重复（检测尾部n-gram三连）
+                                if enable_repeat_guard:
+                                    tail = result[-480:]
+                                    if len(tail) >= 120:
+                                        n = 120
+                                        a = tail[-n:]
+                                        b = tail[-2*n:-n]
+                                        c = tail[-3*n:-2*n]
+                                        if a and a == b == c:
+                                            if self.logger:
+                                                self.logger.warning(f"{log_prefix}: 检测到尾部片段重复三次，提前停止读取。")
+                                            finish_reason = "repetition_guard"
+                                            break
+
+                                # 哨兵：检测结论行
+                                # 之前的输出已检查过，只需在新增片段附近查找
+                                if sentinel_prefix and sentinel_prefix in result[-(len(content) + len(sentinel_prefix)):]:
+                                    # 找到结论行后提前结束
+                                    finish_reason = "sentinel"
+                                    break
+                    finally:
+                        resp.close()
+
                     # 收尾：统一用 flush 逻辑
                     if current_line:
                         flush_current_line('end')
@@ -344,6 +359,12 @@ class StreamingHandler:
                         self.logger.error(f"{log_prefix}: 第{attempt + 1}次尝试失败: {error_msg}")
                         self.logger.debug(f"详细错误信息:\n{error_detail}", mode=UnifiedLogger.LogMode.FILE)
                     
+                    # 400（如上下文超长、参数非法）重发同一请求必然再次失败，直接抛出交给上层降级
+                    if isinstance(e, BadRequestError):
+                        if self.logger:
+                            self.logger.error(f"{log_prefix}: 请求被拒绝（400），不再重试")
+                        raise e
+
                     # 如果是最后一次尝试，抛出异常
                     if attempt == max_retries:
                         if self.logger:
@@ -381,17 +402,31 @@ class StreamingHandler:
         )
 
     # ===== Utilities =====
-    def _format_messages(self, messages: list) -> str:
+    def _format_messages(self, messages: list, log_prefix: str = "") -> str:
         try:
             lines: list[str] = []
             if not isinstance(messages, list):
                 return str(messages)
-            for i, m in enumerate(messages, start=1):
+            current: List[Tuple[str, str]] = []
+            for m in messages:
                 role = m.get('role', 'user') if isinstance(m, dict) else 'user'
                 content = m.get('content', '') if isinstance(m, dict) else str(m)
+                current.append((role, str(content)))
+            # 与同类上一次调用相同的前导消息只记一行占位，日志大小随新增内容而非整段 prompt 增长
+            if self.logger is not self._last_logged_logger:
+                self._last_logged_messages = {}
+                self._last_logged_logger = self.logger
+            previous = self._last_logged_messages.get(log_prefix, [])
+            same = 0
+            while same < len(current) and same < len(previous) and current[same] == previous[same]:
+                same += 1
+            self._last_logged_messages[log_prefix] = current
+            if same:
+                lines.append(f"[1-{same}] 与上一次{log_prefix}调用相同，省略")
+            for i, (role, content) in enumerate(current[same:], start=same + 1):
                 lines.append(f"[{i}] role={role}")
                 # 直接输出完整内容，避免可读性差的repr
-                lines.append(str(content))
+                lines.append(content)
             return "\n".join(lines)
         except Exception:
             return str(messages)
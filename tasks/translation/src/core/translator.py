@@ -15,6 +15,7 @@ from .config import TranslationConfig
 from .logger import UnifiedLogger
 from .quality_checker import QualityChecker
 from .prompt import PromptBuilder, create_config
+from ..utils.file import read_text_cached
 from ..utils.text.cleaning import clean_output_text, detect_and_truncate_repetition
 from ..utils.text.token_estimation import calculate_max_tokens_for_messages, log_model_call
 from .streaming_handler import StreamingHandler
@@ -43,11 +44,13 @@ class Translator:
         if hasattr(self.quality_checker, 'streaming_handler'):
             self.quality_checker.streaming_handler.logger = logger
         # 初始化 OpenAI 兼容客户端（支持 vLLM/Ollama/OpenAI/OpenRouter）
+        # 质量检测器解析出的连接与本翻译器完全一致时直接复用其客户端，共享一个连接池
         self.client = self._create_client(
             self.config.llm_provider,
             self.config.llm_base_url,
             self.config.llm_api_key,
             log_openrouter=True,
+            reuse=self._reusable_qc_client(),
         )
         self.profile_manager = ProfileManager(config.profiles_file)
         self.streaming_handler = StreamingHandler(self.client, logger, config, self.profile_manager)
@@ -69,6 +72,24 @@ class Translator:
         self.prompt_builder = PromptBuilder(prompt_config)
         self.name_glossary_context = ""
 
+    def _reusable_qc_client(self) -> Optional[OpenAI]:
+        """质检客户端的 (provider, base_url, api_key) 与超时都和本翻译器相同时返回它，否则 None。"""
+        qc_client = getattr(self.quality_checker, 'client', None)
+        qc_config = getattr(self.quality_checker, 'config', None)
+        if not isinstance(qc_client, OpenAI) or qc_config is None:
+            return None
+        own = self._resolve_connection(self.config.llm_provider, self.config.llm_base_url, self.config.llm_api_key)
+        theirs = self._resolve_connection(
+            getattr(qc_config, 'llm_provider', None),
+            getattr(qc_config, 'llm_base_url', None),
+            getattr(qc_config, 'llm_api_key', None),
+        )
+        own_timeout = getattr(self.config, "request_timeout_s", 60) or 60
+        their_timeout = getattr(qc_config, "request_timeout_s", 60) or 60
+        if own != theirs or own_timeout != their_timeout:
+            return None
+        return qc_client
+
     def _resolve_connection(
         self,
         provider_value: Optional[str],
@@ -100,6 +121,7 @@ class Translator:
         api_key_value: Optional[str],
         *,
         log_openrouter: bool = False,
+        reuse: Optional[OpenAI] = None,
     ) -> OpenAI:
         provider, base_url, api_key = self._resolve_connection(provider_value, base_url_value, api_key_value)
 
@@ -109,6 +131,9 @@ class Translator:
         elif log_openrouter and provider == "openrouter":
             self.logger.warning(f"⚠️ OpenRouter API key 未设置，provider={provider}, api_key={api_key}")
 
+        if reuse is not None:
+            return reuse
+
         client_timeout = getattr(self.config, "request_timeout_s", 60) or 60
         if provider == "openrouter":
             default_headers = {
@@ -352,20 +377,17 @@ class Translator:
     def _build_messages_generic(self, text: str, preface_path: Optional[Path], sample_path: Optional[Path], add_samples: bool, default_preface: str, log_label: str) -> list:
         parts: list[str] = []
         # preface
-        if preface_path and Path(preface_path).exists():
-            with open(preface_path, 'r', encoding='utf-8') as f:
-                parts.append(f.read().strip())
-        else:
-            parts.append(default_preface)
+        preface = read_text_cached(preface_path) if preface_path else None
+        parts.append(preface.strip() if preface is not None else default_preface)
         # terminology
-        if self.config.terminology_file and self.config.terminology_file.exists():
-            with open(self.config.terminology_file, 'r', encoding='utf-8') as f:
-                parts.append("术语对照表：\n" + f.read().strip())
+        terminology = read_text_cached(self.config.terminology_file) if self.config.terminology_file else None
+        if terminology is not None:
+            parts.append("术语对照表：\n" + terminology.strip())
         self._append_runtime_name_glossary(parts)
         # samples (optional)
-        if add_samples and sample_path and Path(sample_path).exists():
-            with open(sample_path, 'r', encoding='utf-8') as f:
-                parts.append("示例（Few-shot）：\n" + f.read().strip())
+        samples = read_text_cached(sample_path) if add_samples and sample_path else None
+        if samples is not None:
+            parts.append("示例（Few-shot）：\n" + samples.strip())
         # wrap input
         parts.append(text)
         content = "\n\n".join(parts)
@@ -426,13 +448,13 @@ class Translator:
         )
         # 前言
         preface_path = self.config.preface_yaml_file or self.config.preface_file
-        if preface_path and Path(preface_path).exists():
-            with open(preface_path, 'r', encoding='utf-8') as f:
-                parts.append(f.read().strip())
+        preface = read_text_cached(preface_path) if preface_path else None
+        if preface is not None:
+            parts.append(preface.strip())
         # 术语
-        if self.config.terminology_file and self.config.terminology_file.exists():
-            with open(self.config.terminology_file, 'r', encoding='utf-8') as f:
-                parts.append("术语对照表：\n" + f.read().strip())
+        terminology = read_text_cached(self.config.terminology_file) if self.config.terminology_file else None
+        if terminology is not None:
+            parts.append("术语对照表：\n" + terminology.strip())
         self._append_runtime_name_glossary(parts)
         # 构造用户段
         def render_tags(items: list[str]) -> str:
@@ -611,6 +633,9 @@ class Translator:
             # 为小批/逐行提供生成下限，避免被思考阶段占满
             if max_tokens is None or max_tokens < 1024:
                 max_tokens = 1024
+            # 按实际输入长度收紧到上下文余量内，避免超长批次必然触发上下文溢出再降级重试
+            if getattr(self.config, "token_estimator", "auto") != "simple":
+                max_tokens = self._calculate_max_tokens(messages, requested_max_tokens=max_tokens)
             params = self.profile_manager.get_generation_params(
                 "bilingual_simple",
                 max_tokens=max_tokens
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Tests for sharing the quality checker's OpenAI client with the translator."""
+
+import unittest
+
+try:
+    from .config import TranslationConfig
+    from .logger import UnifiedLogger
+    from .quality_checker import QualityChecker
+    from .translator import Translator
+except ImportError:  # unittest discover may import this test as top-level core.translator_client_test.
+    from tasks.translation.src.core.config import TranslationConfig
+    from tasks.translation.src.core.logger import UnifiedLogger
+    from tasks.translation.src.core.quality_checker import QualityChecker
+    from tasks.translation.src.core.translator import Translator
+
+
+class TranslatorClientReuseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.logger = UnifiedLogger.create_console_only()
+
+    def test_reuses_quality_checker_client_for_same_connection(self) -> None:
+        config = TranslationConfig(llm_provider="vllm", llm_base_url="http://127.0.0.1:8000/v1")
+        checker = QualityChecker(config, self.logger)
+
+        translator = Translator(config, self.logger, checker)
+
+        self.assertIs(translator.client, checker.client)
+
+    def test_builds_own_client_when_connection_differs(self) -> None:
+        checker = QualityChecker(
+            TranslationConfig(llm_provider="vllm", llm_base_url="http://127.0.0.1:8000/v1"), self.logger
+        )
+        for config in (
+            TranslationConfig(llm_provider="ollama"),
+            TranslationConfig(llm_provider="vllm", llm_base_url="http://127.0.0.1:8001/v1"),
+            TranslationConfig(llm_provider="vllm", llm_base_url="http://127.0.0.1:8000/v1", llm_api_key="k"),
+        ):
+            translator = Translator(config, self.logger, checker)
+            self.assertIsNot(translator.client, checker.client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for sizing translate_lines_simple max_tokens against the remaining context."""
+
+import os
+import unittest
+from unittest import mock
+
+try:
+    from . import translator as translator_module
+    from .config import TranslationConfig
+    from .logger import UnifiedLogger
+    from .quality_checker import QualityChecker
+    from ..utils.text import token_analyzer
+except ImportError:  # unittest discover may import this test as top-level core.translator_max_tokens_test.
+    from tasks.translation.src.core import translator as translator_module
+    from tasks.translation.src.core.config import TranslationConfig
+    from tasks.translation.src.core.logger import UnifiedLogger
+    from tasks.translation.src.core.quality_checker import QualityChecker
+    from tasks.translation.src.utils.text import token_analyzer
+
+
+class TranslateLinesSimpleMaxTokensTest(unittest.TestCase):
+    def _translator(self, **config_kwargs):
+        config = TranslationConfig(llm_provider="vllm", realtime_log=False, **config_kwargs)
+        logger = UnifiedLogger.create_console_only()
+        translator = translator_module.Translator(config, logger, QualityChecker(config, logger))
+        translator.streaming_handler = mock.Mock()
+        translator.streaming_handler.stream_with_params.return_value = ("", {})
+        return translator
+
+    def _sent_max_tokens(self, translator, messages, lines):
+        translator.prompt_builder = mock.Mock()
+        translator.prompt_builder.build_messages.return_value = messages
+        translator.translate_lines_simple(lines)
+        return translator.streaming_handler.stream_with_params.call_args.kwargs["params"].max_tokens
+
+    def test_long_prompt_caps_max_tokens_below_requested(self) -> None:
+        translator = self._translator(model="max-tokens-cap-test", max_context_length=4096)
+        translator._estimate_simple_max_tokens = mock.Mock(return_value=4000)
+        messages = [
+            {"role": "system", "content": "翻訳してください。"},
+            {"role": "user", "content": "彼は走った。" * 600},
+        ]
+
+        with mock.patch.dict(os.environ, {"TRANSLATION_FORCE_SIMPLE_ESTIMATOR": "1"}):
+            max_tokens = self._sent_max_tokens(translator, messages, ["彼は走った。"])
+
+        self.assertLess(max_tokens, 4000)
+        self.assertGreaterEqual(max_tokens, 256)
+
+    def test_simple_estimator_skips_the_cap_and_tokenizer(self) -> None:
+        translator = self._translator(token_estimator="simple", max_context_length=4096)
+        messages = [{"role": "user", "content": "彼は走った。" * 600}]
+        lines = ["彼は走った。"] * 20
+
+        with mock.patch.object(
+            translator_module, "calculate_max_tokens_for_messages", side_effect=AssertionError("cap applied")
+        ), mock.patch.object(token_analyzer, "TokenAnalyzer", side_effect=AssertionError("tokenizer loaded")):
+            max_tokens = self._sent_max_tokens(translator, messages, lines)
+
+        self.assertEqual(max_tokens, min(len(lines) * 150 + 1000, 6000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -435,8 +435,10 @@ def main() -> None:
                 exists_with_header = False
                 if txt_path.exists() and not args.overwrite:
                     try:
-                        head = txt_path.read_text(encoding="utf-8", errors="ignore").lstrip()
-                        exists_with_header = head.startswith("---\n")
+                        # 只需判断开头的 YAML 分隔符，读前 4KB 原始字节即可，不解码整篇
+                        with txt_path.open("rb") as f:
+                            head = f.read(4096).lstrip()
+                        exists_with_header = head.startswith((b"---\n", b"---\r"))
                     except Exception:
                         exists_with_header = False
                 if exists_with_header and not args.overwrite:
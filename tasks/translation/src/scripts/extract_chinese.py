@@ -331,6 +331,17 @@ def _is_bilingual_candidate(path: Path) -> bool:
     return False
 
 
+def _find_yaml_end(lines: List[str]) -> int:
+    """返回第二个 `---` 所在行号（YAML 结束行），找不到返回 -1。"""
+    found_first_separator = False
+    for i, line in enumerate(lines):
+        if line.strip() == '---':
+            if found_first_separator:
+                return i
+            found_first_separator = True
+    return -1
+
+
 def _parse_bilingual_pairs(content_lines: List[str]) -> List[Tuple[str, Optional[str]]]:
     """按行解析出 (原文, 译文) 对。"""
     pairs: List[Tuple[str, Optional[str]]] = []
@@ -490,6 +501,19 @@ def _clean_metadata_text(text: str) -> str:
     text = _normalize_whitespace(text)
     return text
 
+# 顶格 YAML key -> 本地化字段；同义 key 归到同一字段，后出现的覆盖先出现的
+_LOCALIZED_YAML_FIELDS = {
+    'novel_id': 'id', 'post_id': 'id', 'ID': 'id',
+    'title': 'title',
+    'caption': 'caption',
+    'excerpt': 'excerpt',
+    'tags': 'tags',
+    'create_date': 'create_date', 'published_at': 'create_date',
+    'update_date': 'update_date', 'updated_at': 'update_date',
+    'fee_required': 'fee_required',
+}
+
+
 def _transform_yaml_to_localized(chinese_yaml: str) -> List[str]:
     """将提取到的英文key元信息转换为中文本地化键名，并清理内容。
     目标键名顺序：ID, 标题, 简介, 摘要, 系列(可选), 标签
@@ -504,38 +528,19 @@ def _transform_yaml_to_localized(chinese_yaml: str) -> List[str]:
         return []
 
     lines = chinese_yaml.split('\n')
-    id_value: Optional[str] = None
-    title_value: Optional[str] = None
-    caption_value: Optional[str] = None
-    excerpt_value: Optional[str] = None
+    values: Dict[str, str] = {}
     series_title_value: Optional[str] = None
-    tags_value: Optional[str] = None
-    create_date_value: Optional[str] = None
-    update_date_value: Optional[str] = None
-    fee_required_value: Optional[str] = None
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        # 规范空白
-        raw = line.rstrip('\n')
-        if raw.startswith('novel_id:') or raw.startswith('post_id:') or raw.startswith('ID:'):
-            id_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('title:'):
-            title_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('caption:'):
-            caption_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('excerpt:'):
-            excerpt_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('tags:'):
-            tags_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('create_date:') or raw.startswith('published_at:'):
-            create_date_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('update_date:') or raw.startswith('updated_at:'):
-            update_date_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('fee_required:'):
-            fee_required_value = _clean_metadata_text(raw.split(':', 1)[1])
-        elif raw.startswith('series:'):
+    for i, raw in enumerate(lines):
+        # 顶格 key 取到第一个冒号为止，查表代替逐个 startswith
+        pos = raw.find(':')
+        if pos <= 0:
+            continue
+        key = raw[:pos]
+        field = _LOCALIZED_YAML_FIELDS.get(key)
+        if field is not None:
+            values[field] = _clean_metadata_text(raw[pos + 1:])
+        elif key == 'series':
             # 读取子字段 title
             j = i + 1
             while j < len(lines) and lines[j].startswith('  '):
@@ -544,8 +549,15 @@ def _transform_yaml_to_localized(chinese_yaml: str) -> List[str]:
                     series_title_value = _clean_metadata_text(sub.split(':', 1)[1])
                     break
                 j += 1
-            # 跳过由外部逻辑控制递增，这里不改变 i
-        i += 1
+
+    id_value = values.get('id')
+    title_value = values.get('title')
+    caption_value = values.get('caption')
+    excerpt_value = values.get('excerpt')
+    tags_value = values.get('tags')
+    create_date_value = values.get('create_date')
+    update_date_value = values.get('update_date')
+    fee_required_value = values.get('fee_required')
 
     localized: List[str] = []
     if id_value:
@@ -904,16 +916,7 @@ def process_bilingual_file(
         lines = content.split('\n')
         
         # 找到YAML分隔符
-        yaml_end_line = -1
-        found_first_separator = False
-        for i, line in enumerate(lines):
-            if line.strip() == '---':
-                if found_first_separator:
-                    yaml_end_line = i
-                    break
-                else:
-                    found_first_separator = True
-        
+        yaml_end_line = _find_yaml_end(lines)
         if yaml_end_line == -1:
             raise ValueError("未找到YAML分隔符")
         
@@ -928,7 +931,8 @@ def process_bilingual_file(
         structured_metadata = _resolve_structured_metadata(input_path, yaml_novel_id)
 
         title = extract_title_from_yaml(yaml_content, structured_metadata.get("title"))
-        novel_id = extract_novel_id_from_yaml(yaml_content, structured_metadata.get("novel_id"))
+        # YAML 里的 ID 上面已经解析过，这里只补结构化元数据的回退，不再扫一遍 YAML
+        novel_id = yaml_novel_id if yaml_novel_id is not None else structured_metadata.get("novel_id")
         timestamp_dt = _extract_timestamp_from_yaml(yaml_content, structured_metadata.get("timestamp"))
         timestamp_label = timestamp_dt.isoformat() if timestamp_dt else None
 
@@ -953,7 +957,7 @@ def process_bilingual_file(
         result_lines = []
         if chinese_yaml.strip():
             result_lines.append('---')  # YAML部分前的分割线
-            result_lines.extend(chinese_yaml.split('\n'))
+            result_lines.append(chinese_yaml)  # 最终整体 join，不必先拆成行
             result_lines.append('')  # YAML部分后的第一个空行
             result_lines.append('')  # YAML部分后的第二个空行
         result_lines.extend(chinese_content)
@@ -1045,14 +1049,7 @@ def merge_chinese_files(
             try:
                 content = file_path.read_text(encoding='utf-8', errors='ignore')
                 lines = content.split('\n')
-                yaml_end_line = -1
-                found_first_separator = False
-                for i, line in enumerate(lines):
-                    if line.strip() == '---':
-                        if found_first_separator:
-                            yaml_end_line = i
-                            break
-                        found_first_separator = True
+                yaml_end_line = _find_yaml_end(lines)
                 if yaml_end_line == -1:
                     approx_id = _extract_first_int(file_path.stem)
                     _log_article_result(
@@ -1070,7 +1067,7 @@ def merge_chinese_files(
                 content_lines = lines[yaml_end_line + 1:]
                 yaml_novel_id = extract_novel_id_from_yaml(yaml_content)
                 structured_metadata = _resolve_structured_metadata(file_path, yaml_novel_id)
-                novel_id = extract_novel_id_from_yaml(yaml_content, structured_metadata.get("novel_id"))
+                novel_id = yaml_novel_id if yaml_novel_id is not None else structured_metadata.get("novel_id")
                 if novel_id is None:
                     novel_id = _extract_first_int(file_path.stem) or 10**18
                 timestamp_dt = _extract_timestamp_from_yaml(yaml_content, structured_metadata.get("timestamp"))
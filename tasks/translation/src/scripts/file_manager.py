@@ -6,9 +6,40 @@
 
 import argparse
 import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
+
+try:  # 大 index.json 用 orjson 直接解析 bytes，缺失时回退标准库
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 日文判定沿用原逻辑：平假名/片假名/常用汉字任一即算
+JAPANESE_RE = re.compile(r"[\u3040-\u30FF\u4E00-\u9FAF]")
+CHINESE_RE = re.compile(r"[\u4E00-\u9FAF]")
+# bilingual_simple 产物里不应出现的省略/对话标记/状态/错误信息
+BILINGUAL_ERROR_PATTERNS = (
+    "（以下省略）", "（省略）", "无法翻译",
+    "User:", "Assistant:",
+    "思考中", "正在翻译", "请稍候",
+    "ERROR", "FAILED", "EXCEPTION",
+)
+BILINGUAL_ERROR_RE = re.compile("|".join(map(re.escape, BILINGUAL_ERROR_PATTERNS)))
+# 属于系列的文章会带着这些产物一起改名为 {series_id}_{novel_id}{suffix}
+SERIES_FILE_SUFFIXES = (
+    ".txt", "_zh.txt", "_bilingual.txt",
+    "_awq_zh.txt", "_awq_bilingual.txt", ".meta.json",
+)
+READ_CHUNK_CHARS = 64 * 1024
+# 分块扫描时保留上一块的尾巴，避免标记跨块边界被漏掉
+_ERROR_OVERLAP = max(map(len, BILINGUAL_ERROR_PATTERNS)) - 1
+
 
 def rename_series_files(base_dir: Path, dry_run: bool = False) -> bool:
     """
@@ -23,8 +54,7 @@ def rename_series_files(base_dir: Path, dry_run: bool = False) -> bool:
     
     try:
         # 读取index.json
-        with open(index_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _json_loads(index_file.read_bytes())
     except Exception as e:
         print(f"错误: 读取 index.json 失败: {e}")
         return False
@@ -41,66 +71,64 @@ def rename_series_files(base_dir: Path, dry_run: bool = False) -> bool:
         print("(试运行模式，不会实际重命名文件)")
     
     success_count = 0
+    # 一次列目录，之后的存在性判断都查内存集合，不再逐个 stat
+    existing = {entry.name for entry in os.scandir(base_dir)}
     total_count = 0
+    already_done = 0
     
     for series_id, novel_ids in by_series.items():
-        print(f"\n处理系列 {series_id}，包含 {len(novel_ids)} 篇文章:")
+        # 本系列的消息先攒起来；重命名先在内存里排好并检查冲突，
+        # 为每个重命名在 log 里占一个位置，执行后填入结果，保证消息仍按文件顺序归在系列标题下
+        log: List[str] = [f"\n处理系列 {series_id}，包含 {len(novel_ids)} 篇文章:"]
+        plan: List[Tuple[int, str, str]] = []
         
         for novel_id in novel_ids:
-            # 查找所有相关文件（包含常见后缀与meta）
-            old_files = [
-                base_dir / f"{novel_id}.txt",
-                base_dir / f"{novel_id}_zh.txt",
-                base_dir / f"{novel_id}_bilingual.txt",
-                base_dir / f"{novel_id}_awq_zh.txt",
-                base_dir / f"{novel_id}_awq_bilingual.txt",
-                base_dir / f"{novel_id}.meta.json",
-            ]
-            
-            for old_file in old_files:
-                if not old_file.exists():
+            # 查找所有相关文件（包含常见后缀与meta），新文件名统一是加上系列前缀
+            for suffix in SERIES_FILE_SUFFIXES:
+                name = f"{novel_id}{suffix}"
+                new_name = f"{series_id}_{name}"
+                if name not in existing:
+                    # 之前的运行已经改过名，直接跳过
+                    if new_name in existing:
+                        already_done += 1
                     continue
                 total_count += 1
                 
-                # 构建新文件名
-                name = old_file.name
-                if name == f"{novel_id}.txt":
-                    new_name = f"{series_id}_{novel_id}.txt"
-                elif name == f"{novel_id}_zh.txt":
-                    new_name = f"{series_id}_{novel_id}_zh.txt"
-                elif name == f"{novel_id}_bilingual.txt":
-                    new_name = f"{series_id}_{novel_id}_bilingual.txt"
-                elif name == f"{novel_id}_awq_zh.txt":
-                    new_name = f"{series_id}_{novel_id}_awq_zh.txt"
-                elif name == f"{novel_id}_awq_bilingual.txt":
-                    new_name = f"{series_id}_{novel_id}_awq_bilingual.txt"
-                elif name == f"{novel_id}.meta.json":
-                    new_name = f"{series_id}_{novel_id}.meta.json"
-                else:
+                if new_name in existing:
+                    log.append(f"  警告: {new_name} 已存在，跳过重命名 {name}")
                     continue
-                
-                new_file = base_dir / new_name
-                
-                if old_file.exists():
-                    if new_file.exists():
-                        print(f"  警告: {new_file.name} 已存在，跳过重命名 {old_file.name}")
-                    else:
-                        if dry_run:
-                            print(f"  [试运行] {old_file.name} -> {new_name}")
-                        else:
-                            try:
-                                old_file.rename(new_file)
-                                print(f"  ✓ {old_file.name} -> {new_name}")
-                                success_count += 1
-                            except Exception as e:
-                                print(f"  ✗ 重命名失败 {old_file.name}: {e}")
-                else:
-                    print(f"  - 文件不存在: {old_file.name}")
+                plan.append((len(log), name, new_name))
+                log.append("")
+                existing.discard(name)
+                existing.add(new_name)
+        
+        for slot, name, new_name in plan:
+            if dry_run:
+                log[slot] = f"  [试运行] {name} -> {new_name}"
+                continue
+            try:
+                os.rename(base_dir / name, base_dir / new_name)
+                log[slot] = f"  ✓ {name} -> {new_name}"
+                success_count += 1
+            except Exception as e:
+                existing.discard(new_name)
+                existing.add(name)
+                log[slot] = f"  ✗ 重命名失败 {name}: {e}"
+        print("\n".join(log))
     
-    print(f"\n重命名完成! 成功: {success_count}/{total_count}")
+    print(f"\n重命名完成! 成功: {success_count}/{total_count}" + (f"，此前已重命名: {already_done}" if already_done else ""))
     return True
 
 
+def count_file_chars(file_path: Path) -> int:
+    """按块解码统计字符数，不在内存里拼出整篇文本"""
+    total = 0
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_CHARS), ''):
+            total += len(chunk)
+    return total
+
+
 def list_files_by_length(base_dir: Path, pattern: str = "*.txt", reverse: bool = True) -> List[tuple]:
     """
     列出文件并按长度排序
@@ -110,9 +138,7 @@ def list_files_by_length(base_dir: Path, pattern: str = "*.txt", reverse: bool =
     
     for file_path in files:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            length = len(content)
+            length = count_file_chars(file_path)
             file_lengths.append((file_path, length))
         except Exception as e:
             print(f"读取文件失败 {file_path}: {e}")
@@ -123,82 +149,71 @@ def list_files_by_length(base_dir: Path, pattern: str = "*.txt", reverse: bool =
     return file_lengths
 
 
+def check_bilingual_content(content: str, check_markers: bool = True) -> bool:
+    """
+    检查双语文本内容质量（专门针对bilingual_simple模式优化）
+
+    check_markers=False 时跳过错误标记扫描，供已逐块扫描过的调用方使用
+    """
+    # 1. 基本长度检查
+    if len(content) < 200:  # bilingual_simple 模式应该有更长的内容
+        return False
+    
+    # 2. 检查 bilingual_simple 特有的错误模式
+    if check_markers and BILINGUAL_ERROR_RE.search(content):
+        return False
+    
+    # 3. 检查双语格式是否正确
+    lines = content.split('\n')
+    if len(lines) < 10:  # bilingual_simple 应该有足够的行数
+        return False
+    
+    # 4. 检查是否包含日文和中文（双语特征）
+    has_jp = JAPANESE_RE.search(content) is not None
+    has_cn = CHINESE_RE.search(content) is not None
+    
+    if not (has_jp and has_cn):
+        return False
+    
+    # 5. 检查双语对的数量：连续两行都有内容，可能是双语对
+    non_empty = [bool(line.strip()) for line in lines]
+    bilingual_pairs = sum(1 for a, b in zip(non_empty, non_empty[1:]) if a and b)
+    
+    # 至少应该有10对双语内容
+    return bilingual_pairs >= 10
+
+
 def check_bilingual_quality(file_path: Path) -> bool:
     """
-    检查双语文件质量（专门针对bilingual_simple模式优化）
+    检查双语文件质量，读取失败视为低质量
     """
+    chunks = []
+    tail = ''
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 1. 基本长度检查
-        if len(content) < 200:  # bilingual_simple 模式应该有更长的内容
-            return False
-        
-        # 2. 检查 bilingual_simple 特有的错误模式
-        error_patterns = [
-            "（以下省略）", "（省略）", "无法翻译",
-            "User:", "Assistant:",  # 不应该包含这些标记
-            "思考中", "正在翻译", "请稍候",  # 不应该包含这些状态信息
-            "ERROR", "FAILED", "EXCEPTION"  # 不应该包含错误信息
-        ]
-        
-        for pattern in error_patterns:
-            if pattern in content:
-                return False
-        
-        # 3. 检查双语格式是否正确
-        lines = content.split('\n')
-        if len(lines) < 10:  # bilingual_simple 应该有足够的行数
-            return False
-        
-        # 4. 检查是否包含日文和中文（双语特征）
-        def has_japanese_text(text):
-            for char in text:
-                # 平假名
-                if 0x3040 <= ord(char) <= 0x309F:
-                    return True
-                # 片假名
-                if 0x30A0 <= ord(char) <= 0x30FF:
-                    return True
-                # 汉字（日文常用汉字范围）
-                if 0x4E00 <= ord(char) <= 0x9FAF:
-                    return True
-            return False
-        
-        def has_chinese_text(text):
-            for char in text:
-                # 中文字符
-                if 0x4E00 <= ord(char) <= 0x9FAF:
-                    return True
-            return False
-        
-        # 检查是否同时包含日文和中文
-        has_jp = has_japanese_text(content)
-        has_cn = has_chinese_text(content)
-        
-        if not (has_jp and has_cn):
-            return False
-        
-        # 5. 检查双语对的数量
-        bilingual_pairs = 0
-        for i in range(len(lines) - 1):
-            if lines[i].strip() and lines[i + 1].strip():
-                # 简单检查：如果连续两行都有内容，可能是双语对
-                bilingual_pairs += 1
-        
-        # 至少应该有10对双语内容
-        if bilingual_pairs < 10:
-            return False
-        
-        return True
-        
+            for chunk in iter(lambda: f.read(READ_CHUNK_CHARS), ''):
+                # 命中错误标记即提前返回，不再读剩余内容
+                if BILINGUAL_ERROR_RE.search(tail + chunk):
+                    return False
+                chunks.append(chunk)
+                tail = chunk[-_ERROR_OVERLAP:]
     except Exception as e:
         print(f"检查文件质量失败 {file_path}: {e}")
         return False
+    return check_bilingual_content(''.join(chunks), check_markers=False)
+
+
+def check_bilingual_quality_many(files: List[Path], workers: Optional[int] = None) -> List[bool]:
+    """
+    并行检查多个双语文件质量，结果顺序与输入一致；workers=1 时顺序执行
+    """
+    if workers == 1 or len(files) < 2:
+        return [check_bilingual_quality(file_path) for file_path in files]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(check_bilingual_quality, files, chunksize=8))
 
 
-def cleanup_low_quality_files(base_dir: Path, dry_run: bool = False) -> bool:
+def cleanup_low_quality_files(base_dir: Path, dry_run: bool = False, workers: Optional[int] = None) -> bool:
     """
     清理低质量的双语文件
     """
@@ -209,8 +224,8 @@ def cleanup_low_quality_files(base_dir: Path, dry_run: bool = False) -> bool:
     bilingual_files = list(base_dir.rglob("*_bilingual.txt"))
     low_quality_files = []
     
-    for file_path in bilingual_files:
-        if not check_bilingual_quality(file_path):
+    for file_path, ok in zip(bilingual_files, check_bilingual_quality_many(bilingual_files, workers)):
+        if not ok:
             low_quality_files.append(file_path)
             print(f"低质量文件: {file_path}")
     
@@ -247,6 +262,8 @@ def main():
                        help="按长度升序排列 (仅用于list命令，默认降序)")
     parser.add_argument("--dry-run", action="store_true",
                        help="试运行模式，不实际执行操作")
+    parser.add_argument("--workers", type=int, default=0,
+                       help="cleanup 并行检查的进程数 (0=CPU 核数, 1=顺序执行)")
     parser.add_argument("--limit", type=int, default=0,
                        help="限制显示/处理文件数量 (0=无限制)")
     
@@ -276,7 +293,7 @@ def main():
         print(f"\n总计: {len(files)} 个文件")
     
     elif args.command == "cleanup":
-        success = cleanup_low_quality_files(base_dir, args.dry_run)
+        success = cleanup_low_quality_files(base_dir, args.dry_run, args.workers or None)
         sys.exit(0 if success else 1)
 
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+
+_FILE = Path(__file__).resolve()
+_REPO_ROOT = _FILE.parents[4]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from tasks.translation.src.scripts import file_manager
+from tasks.translation.src.scripts.file_manager import (
+    check_bilingual_content,
+    check_bilingual_quality,
+    check_bilingual_quality_many,
+    count_file_chars,
+    rename_series_files,
+)
+
+
+def _bilingual_text(pairs: int = 12) -> str:
+    lines = []
+    for i in range(pairs):
+        lines.append(f"これは{i}番目のテスト文章です。少し長めに書いています。")
+        lines.append(f"这是第{i}句测试文本，写得稍微长一点。")
+        lines.append("")
+    return "\n".join(lines)
+
+
+class CheckBilingualContentTest(unittest.TestCase):
+    def test_accepts_paired_japanese_chinese(self):
+        self.assertTrue(check_bilingual_content(_bilingual_text()))
+
+    def test_rejects_short_content(self):
+        self.assertFalse(check_bilingual_content(_bilingual_text(1)))
+
+    def test_rejects_error_marker(self):
+        self.assertFalse(check_bilingual_content(_bilingual_text() + "\nAssistant: 好的"))
+
+    def test_marker_scan_can_be_skipped_by_prescanned_callers(self):
+        self.assertTrue(check_bilingual_content(_bilingual_text() + "\nAssistant: 好的", check_markers=False))
+
+    def test_rejects_without_japanese_kana_or_kanji(self):
+        text = "\n".join("This line is plain English text only." for _ in range(30))
+        self.assertFalse(check_bilingual_content(text))
+
+
+class CheckBilingualQualityTest(unittest.TestCase):
+    def test_reads_file_and_treats_missing_as_low_quality(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "1_bilingual.txt"
+            path.write_text(_bilingual_text(), encoding="utf-8")
+            self.assertTrue(check_bilingual_quality(path))
+            self.assertFalse(check_bilingual_quality(Path(tmp) / "missing_bilingual.txt"))
+
+    def test_detects_marker_split_across_read_chunks(self):
+        text = _bilingual_text()
+        marker = "Assistant:"
+        boundary = file_manager.READ_CHUNK_CHARS
+        padded = text + "x" * (boundary - len(text) - 4) + marker + "\n" + text
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "1_bilingual.txt"
+            path.write_text(padded, encoding="utf-8")
+            self.assertFalse(check_bilingual_quality(path))
+
+    def test_many_preserves_input_order_in_parallel(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(6):
+                path = Path(tmp) / f"{i}_bilingual.txt"
+                path.write_text(_bilingual_text() if i % 2 == 0 else "短い", encoding="utf-8")
+                paths.append(path)
+            expected = [True, False, True, False, True, False]
+            self.assertEqual(check_bilingual_quality_many(paths, workers=2), expected)
+            self.assertEqual(check_bilingual_quality_many(paths, workers=1), expected)
+
+
+class CountFileCharsTest(unittest.TestCase):
+    def test_counts_characters_not_bytes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "1.txt"
+            path.write_text("日本語" * 30000, encoding="utf-8")
+            self.assertEqual(count_file_chars(path), 90000)
+
+
+class RenameSeriesFilesTest(unittest.TestCase):
+    def test_renames_known_suffixes_and_skips_existing_targets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            index = {"_summary": {"by_series": {"900": ["1", "2"]}}}
+            (base / "index.json").write_text(json.dumps(index), encoding="utf-8")
+            for name in ("1.txt", "1_zh.txt", "1.meta.json", "1_other.txt", "2.txt", "900_2.txt"):
+                (base / name).write_text(name, encoding="utf-8")
+
+            self.assertTrue(rename_series_files(base))
+
+            names = sorted(p.name for p in base.iterdir())
+            self.assertEqual(
+                names,
+                ["1_other.txt", "2.txt", "900_1.meta.json", "900_1.txt", "900_1_zh.txt", "900_2.txt", "index.json"],
+            )
+            self.assertEqual((base / "900_2.txt").read_text(encoding="utf-8"), "900_2.txt")
+
+            # 再跑一次：已改名的文件不再动，冲突的 2.txt 仍保留
+            self.assertTrue(rename_series_files(base))
+            self.assertEqual(sorted(p.name for p in base.iterdir()), names)
+
+    def test_dry_run_groups_file_lines_under_their_series(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            index = {"_summary": {"by_series": {"900": ["1", "2"], "901": ["3"]}}}
+            (base / "index.json").write_text(json.dumps(index), encoding="utf-8")
+            for name in ("1.txt", "2.txt", "900_2.txt", "3.txt"):
+                (base / name).write_text(name, encoding="utf-8")
+
+            buf = io.StringIO()
+            with redirect_stdout(buf):
+                self.assertTrue(rename_series_files(base, dry_run=True))
+
+            lines = [ln for ln in buf.getvalue().splitlines() if ln.startswith(("处理系列", "  "))]
+            self.assertEqual(
+                lines,
+                [
+                    "处理系列 900，包含 2 篇文章:",
+                    "  [试运行] 1.txt -> 900_1.txt",
+                    "  警告: 900_2.txt 已存在，跳过重命名 2.txt",
+                    "处理系列 901，包含 1 篇文章:",
+                    "  [试运行] 3.txt -> 901_3.txt",
+                ],
+            )
+            self.assertTrue((base / "1.txt").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,14 +10,14 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 from src.core.config import TranslationConfig
-from src.core.pipeline import TranslationPipeline
-from src.core.qa_gate import TranslationQAGate, collect_output_files, infer_source_for_output
 from src.cli import create_argument_parser, validate_args, setup_default_paths
 from src.utils.presets import prepare_preset_defaults
 
 
 def run_qa_only(config: TranslationConfig, inputs: list[str]) -> int:
     """Generate hard-rule QA reports for existing translated output files."""
+    from src.core.qa_gate import TranslationQAGate, collect_output_files, infer_source_for_output
+
     files = collect_output_files(inputs)
     if not files:
         print("没有找到需要 QA 的输出文件")
@@ -45,7 +45,7 @@ def main() -> None:
     """主函数"""
     raw_argv = sys.argv[1:]
 
-    preset_parser = argparse.ArgumentParser(add_help=False)
+    preset_parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
     preset_parser.add_argument("--preset")
     preset_parser.add_argument("--presets-file")
     preset_args, _ = preset_parser.parse_known_args(raw_argv)
@@ -72,7 +72,9 @@ def main() -> None:
         config.qa_report = True
         sys.exit(run_qa_only(config, args.inputs))
     
-    # 创建翻译流程
+    # 创建翻译流程（流水线依赖 openai/tokenizer 等，参数校验通过后再导入）
+    from src.core.pipeline import TranslationPipeline
+
     pipeline = TranslationPipeline(config)
     
     # 运行翻译
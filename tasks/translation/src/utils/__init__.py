@@ -16,7 +16,8 @@ from .text import (
 from .file import (
     parse_yaml_front_matter,
     clean_filename,
-    generate_output_filename
+    generate_output_filename,
+    read_text_cached
 )
 
 # 格式化工具
@@ -37,6 +38,7 @@ __all__ = [
     'parse_yaml_front_matter',
     'clean_filename',
     'generate_output_filename',
+    'read_text_cached',
 
     # 格式化
     'create_bilingual_output',
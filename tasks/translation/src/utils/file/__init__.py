@@ -5,9 +5,11 @@
 
 from .yaml_parser import parse_yaml_front_matter
 from .filename_utils import clean_filename, generate_output_filename
+from .cached_read import read_text_cached
 
 __all__ = [
     'parse_yaml_front_matter',
     'clean_filename',
-    'generate_output_filename'
+    'generate_output_filename',
+    'read_text_cached'
 ]
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+提示资产读取缓存
+
+preface / 术语表 / few-shot 样例在每个批次、每次重试都会被重新拼进 prompt，
+内容在一次运行中几乎不变。这里按 (路径, mtime, 大小) 缓存文件内容，
+文件被编辑后键变化，自动重新读取。
+"""
+
+import os
+import stat
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+
+@lru_cache(maxsize=32)
+def _read_text(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def read_text_cached(path: Union[str, Path]) -> Optional[str]:
+    """
+    读取UTF-8文本文件，内容按修改时间缓存
+
+    Args:
+        path: 文件路径
+
+    Returns:
+        文件内容；文件不存在或不是普通文件时返回 None
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _read_text(os.fspath(path), st.st_mtime_ns, st.st_size)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from .cached_read import read_text_cached
+
+
+class TestReadTextCached(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_missing_or_directory_returns_none(self):
+        self.assertIsNone(read_text_cached(self.root / "missing.txt"))
+        self.assertIsNone(read_text_cached(self.root))
+
+    def test_rereads_after_file_changes(self):
+        path = self.root / "preface.txt"
+        path.write_text("旧前言", encoding="utf-8")
+        self.assertEqual(read_text_cached(path), "旧前言")
+        self.assertEqual(read_text_cached(str(path)), "旧前言")
+
+        path.write_text("新的前言内容", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(read_text_cached(path), "新的前言内容")
+
+
+if __name__ == "__main__":
+    unittest.main()
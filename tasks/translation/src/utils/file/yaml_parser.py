@@ -21,12 +21,19 @@ def parse_yaml_front_matter(content: str) -> Tuple[Optional[Dict], str]:
     
     try:
         import yaml
-        parts = content.split('---', 2)
-        if len(parts) < 3:
+        # 直接定位第二个分隔符，并按下标收缩首尾空白后只切一次正文
+        # （split + strip 会把整段正文复制两遍）
+        end = content.find('---', 3)
+        if end == -1:
             return None, content
         
-        yaml_content = parts[1].strip()
-        text_content = parts[2].strip()
+        yaml_content = content[3:end].strip()
+        start, stop = end + 3, len(content)
+        while start < stop and content[start].isspace():
+            start += 1
+        while stop > start and content[stop - 1].isspace():
+            stop -= 1
+        text_content = content[start:stop]
         
         yaml_data = yaml.safe_load(yaml_content)
         return yaml_data, text_content
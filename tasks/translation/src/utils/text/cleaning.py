@@ -3,7 +3,27 @@
 文本清理工具
 """
 
+import logging
 import re
+from itertools import groupby
+
+logger = logging.getLogger(__name__)
+
+# 模型输出里的思考块，按原顺序逐个剔除
+_THINK_BLOCK_RES = (
+    re.compile(r'<think>.*?</think>', re.DOTALL),
+    re.compile(r'<thinking>.*?</thinking>', re.DOTALL),
+    re.compile(r'<reasoning>.*?</reasoning>', re.DOTALL),
+)
+# 行首行号："1. 内容" / "123. 内容"，或 "1 内容" / "123 内容"
+_LINE_NUMBER_RE = re.compile(r'^\d+(?:\.\s*|\s+)')
+_EXTRA_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+# 需要剔除的上下文/提示标记，避免被视为译文
+_CONTEXT_MARKERS = frozenset({
+    "【最近上下文】",
+    "【上一批原文片段】",
+    "【上一批译文片段】",
+})
 
 
 def clean_output_text(text: str) -> str:
@@ -22,36 +42,22 @@ def clean_output_text(text: str) -> str:
     # 检测和截断重复模式
     text = detect_and_truncate_repetition(text)
     
-    # 去除 <think>...</think> 部分
-    text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
-    
-    # 去除其他可能的思考标记
-    text = re.sub(r'<thinking>.*?</thinking>', '', text, flags=re.DOTALL)
-    text = re.sub(r'<reasoning>.*?</reasoning>', '', text, flags=re.DOTALL)
+    # 去除 <think>...</think> 以及其他可能的思考标记
+    for pattern in _THINK_BLOCK_RES:
+        text = pattern.sub('', text)
     
     # 去除行号：匹配行首的数字+点号或数字+空格模式
     original_lines = text.split('\n')
     cleaned_lines = []
     line_number_removed = False
-    # 需要剔除的上下文/提示标记，避免被视为译文
-    context_markers = {
-        "【最近上下文】",
-        "【上一批原文片段】",
-        "【上一批译文片段】",
-    }
     
     for line in original_lines:
-        if line.strip() in context_markers:
+        if line.strip() in _CONTEXT_MARKERS:
             continue
-        # 匹配行首的数字+点号模式 (如 "1. 内容" 或 "123. 内容")
-        if re.match(r'^\d+\.\s*', line):
-            cleaned_line = re.sub(r'^\d+\.\s*', '', line)
-            cleaned_lines.append(cleaned_line)
-            line_number_removed = True
-        # 匹配行首的数字+空格模式 (如 "1 内容" 或 "123 内容")
-        elif re.match(r'^\d+\s+', line):
-            cleaned_line = re.sub(r'^\d+\s+', '', line)
-            cleaned_lines.append(cleaned_line)
+        # 一次 match 同时判断并定位行号前缀，直接切片去掉
+        match = _LINE_NUMBER_RE.match(line)
+        if match:
+            cleaned_lines.append(line[match.end():])
             line_number_removed = True
         else:
             cleaned_lines.append(line)
@@ -60,12 +66,10 @@ def clean_output_text(text: str) -> str:
     
     # 记录行号清理日志
     if line_number_removed:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("文本清理: 检测到并移除了行号标记")
     
     # 去除多余的空白行
-    text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
+    text = _EXTRA_BLANK_LINES_RE.sub('\n\n', text)
     
     return text.strip()
 
@@ -88,18 +92,14 @@ def detect_and_truncate_repetition(text: str, max_repeat: int = 20) -> str:
     if len(lines) < 3:
         return text
     
-    # 检查是否有重复的短行
-    for i in range(len(lines) - max_repeat):
-        if len(lines[i].strip()) <= 1:
-            repeat_count = 1
-            for j in range(i + 1, len(lines)):
-                if lines[j].strip() == lines[i].strip():
-                    repeat_count += 1
-                else:
-                    break
-            
-            if repeat_count > max_repeat:
-                # 截断重复部分
-                return '\n'.join(lines[:i + 1])
+    # 检查是否有重复的短行：按 strip 后的内容一次性分段统计连续长度，
+    # 第一个超过阈值的短行段只保留其首行
+    start = 0
+    for stripped, group in groupby(map(str.strip, lines)):
+        run_length = sum(1 for _ in group)
+        if len(stripped) <= 1 and run_length > max_repeat:
+            # 截断重复部分
+            return '\n'.join(lines[:start + 1])
+        start += run_length
     
     return text
@@ -6,12 +6,14 @@
 
 import logging
 import os
-from typing import Optional, Dict
-
-from transformers import AutoTokenizer
+from functools import lru_cache
+from typing import Optional, Dict, List
 
 logger = logging.getLogger(__name__)
 
+# 聊天模板为每条消息额外包裹的角色/分隔符token（如 <|im_start|>role\n ... <|im_end|>\n）
+MESSAGE_OVERHEAD_TOKENS = 5
+
 
 class TokenAnalyzer:
     """准确的Token分析器"""
@@ -21,6 +23,8 @@ class TokenAnalyzer:
         self.model_name = model_name
         self.tokenizer = None
         self._load_tokenizer()
+        # 同一文件各批次的 system/few-shot 前缀内容不变，按内容缓存计数，只对新增部分分词
+        self._count_cached = lru_cache(maxsize=256)(self.count_tokens)
     
     def _load_tokenizer(self):
         """加载tokenizer"""
@@ -34,6 +38,9 @@ class TokenAnalyzer:
         prefer_local_only = os.getenv("TRANSLATION_SKIP_REMOTE_TOKENIZER", "1").lower() in {"1", "true", "yes"}
         allow_remote_download = os.getenv("TRANSLATION_ALLOW_REMOTE_TOKENIZER", "").lower() in {"1", "true", "yes"}
 
+        # transformers 导入耗时数秒，仅在真正加载 tokenizer 时才导入
+        from transformers import AutoTokenizer
+
         def _load(local_only: bool):
             return AutoTokenizer.from_pretrained(
                 self.model_name,
@@ -96,6 +103,21 @@ class TokenAnalyzer:
         # 回退到简单估算
         return len(text) // 3
     
+    def count_message_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """
+        计算消息列表的输入token数量（逐条内容分词并缓存，加上模板开销）
+
+        Args:
+            messages: 消息列表
+
+        Returns:
+            token数量
+        """
+        total = 0
+        for message in messages:
+            total += self._count_cached(message.get("content") or "") + MESSAGE_OVERHEAD_TOKENS
+        return total
+
     def estimate_max_tokens(self, input_text: str, output_ratio: float = 1.2) -> int:
         """
         基于输入文本估算所需的max_tokens
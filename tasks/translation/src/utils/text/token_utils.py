@@ -34,8 +34,10 @@ def calculate_safe_max_tokens(
         analyzer = get_token_analyzer(model_name)
         
         # 计算输入tokens
-        prompt_text = str(messages)
-        input_tokens = analyzer.count_tokens(prompt_text)
+        if isinstance(messages, list):
+            input_tokens = analyzer.count_message_tokens(messages)
+        else:
+            input_tokens = analyzer.count_tokens(str(messages))
         
         # 计算可用的输出tokens
         available_tokens = int((context_limit - input_tokens) * safety_margin) - 128